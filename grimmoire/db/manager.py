@@ -1,11 +1,199 @@
 """Database manager for Grimmoire."""
 import json
-import sqlite3
-from datetime import datetime
+import threading
+import zlib
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Optional, List, Dict, Set
+from typing import Any, Optional, List, Dict, Iterator, Set, Tuple, NamedTuple
 
-from .schema import init_db, get_db_path
+# schema resolves pysqlite3 vs stdlib sqlite3; reuse its choice so the
+# reader connections here come from the same library as the writer.
+from .schema import init_db, get_db_path, sqlite3
+
+# Empty defaults ([], {}) are stored as SQL NULL rather than serialized per
+# call - the hot journal_event/update_job_progress paths never pay json.dumps
+# for a payload-free event, and readers already treat NULL as empty.
+try:  # orjson runs 2-5x faster both ways and emits bytes SQLite binds directly
+    import orjson
+
+    def _dump_json(obj: Any) -> Optional[bytes]:
+        if isinstance(obj, (bytes, str)):  # already serialized upstream
+            return obj or None
+        return orjson.dumps(obj) if obj else None
+
+    _load_json = orjson.loads
+except ImportError:
+    def _dump_json(obj: Any) -> Optional[str]:
+        if isinstance(obj, (bytes, str)):
+            return obj or None
+        return json.dumps(obj) if obj else None
+
+    _load_json = json.loads
+
+
+class PlantSummary(NamedTuple):
+    """Cheap projection of a plant row for code that only needs names."""
+    id: int
+    name: str
+    scientific_name: Optional[str]
+
+
+class IngredientSummary(NamedTuple):
+    id: int
+    name: str
+    molecular_formula: Optional[str]
+
+
+class AilmentSummary(NamedTuple):
+    id: int
+    name: str
+    category: Optional[str]
+
+
+class RecipeSummary(NamedTuple):
+    id: int
+    name: str
+    tradition: Optional[str]
+
+
+# SQL statements as module-level constants so every call binds the exact same
+# string object and SQLite's internal statement cache (sized in init_db) hits
+# consistently instead of reparsing per call.
+_SQL_ADD_PLANT = """
+    INSERT INTO plants (name, scientific_name, family, common_names, description, taxonomy_id)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+_SQL_GET_PLANT = "SELECT * FROM plants WHERE id = ?"
+_SQL_SEARCH_PLANTS = """
+    WITH m AS (SELECT rowid, rank FROM fts_plants WHERE fts_plants MATCH ? ORDER BY rank LIMIT ?)
+    SELECT p.* FROM m JOIN plants p ON p.id = m.rowid ORDER BY m.rank
+"""
+_SQL_SEARCH_PLANTS_TRI = """
+    WITH m AS (SELECT rowid, rank FROM fts_plants_tri WHERE fts_plants_tri MATCH ? ORDER BY rank LIMIT ?)
+    SELECT p.* FROM m JOIN plants p ON p.id = m.rowid ORDER BY m.rank
+"""
+_SQL_ADD_INGREDIENT = """
+    INSERT INTO ingredients (name, synonyms, cas_number, pubchem_cid, inchi_key,
+                             smiles, molecular_formula, molecular_weight, description)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_SQL_GET_INGREDIENT = "SELECT * FROM ingredients WHERE id = ?"
+_SQL_SEARCH_INGREDIENTS = """
+    WITH m AS (SELECT rowid, rank FROM fts_ingredients WHERE fts_ingredients MATCH ? ORDER BY rank LIMIT ?)
+    SELECT i.* FROM m JOIN ingredients i ON i.id = m.rowid ORDER BY m.rank
+"""
+_SQL_SEARCH_INGREDIENTS_TRI = """
+    WITH m AS (SELECT rowid, rank FROM fts_ingredients_tri WHERE fts_ingredients_tri MATCH ? ORDER BY rank LIMIT ?)
+    SELECT i.* FROM m JOIN ingredients i ON i.id = m.rowid ORDER BY m.rank
+"""
+_SQL_ADD_AILMENT = """
+    INSERT INTO ailments (name, synonyms, icd10_code, mesh_id, category, description)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+_SQL_GET_AILMENT = "SELECT * FROM ailments WHERE id = ?"
+_SQL_SEARCH_AILMENTS = """
+    WITH m AS (SELECT rowid, rank FROM fts_ailments WHERE fts_ailments MATCH ? ORDER BY rank LIMIT ?)
+    SELECT a.* FROM m JOIN ailments a ON a.id = m.rowid ORDER BY m.rank
+"""
+_SQL_SEARCH_AILMENTS_TRI = """
+    WITH m AS (SELECT rowid, rank FROM fts_ailments_tri WHERE fts_ailments_tri MATCH ? ORDER BY rank LIMIT ?)
+    SELECT a.* FROM m JOIN ailments a ON a.id = m.rowid ORDER BY m.rank
+"""
+_SQL_ADD_RECIPE = """
+    INSERT INTO recipes (name, tradition, description, preparation, dosage, source_id)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+_SQL_GET_RECIPE = "SELECT * FROM recipes WHERE id = ?"
+_SQL_SEARCH_RECIPES = """
+    WITH m AS (SELECT rowid, rank FROM fts_recipes WHERE fts_recipes MATCH ? ORDER BY rank LIMIT ?)
+    SELECT r.* FROM m JOIN recipes r ON r.id = m.rowid ORDER BY m.rank
+"""
+_SQL_SEARCH_RECIPES_TRI = """
+    WITH m AS (SELECT rowid, rank FROM fts_recipes_tri WHERE fts_recipes_tri MATCH ? ORDER BY rank LIMIT ?)
+    SELECT r.* FROM m JOIN recipes r ON r.id = m.rowid ORDER BY m.rank
+"""
+_SQL_ADD_SOURCE = """
+    INSERT INTO sources (name, url, source_type, priority, enabled, config)
+    VALUES (?, ?, ?, ?, 1, ?)
+"""
+# executemany cannot use RETURNING, so the bulk helpers keep the plain
+# constants above and the single-row adders use these. RETURNING itself
+# needs SQLite 3.35 (2021); _execute_insert falls back to lastrowid on
+# older system libraries.
+_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35)
+_SQL_ADD_PLANT_RETURNING = _SQL_ADD_PLANT + " RETURNING id"
+_SQL_ADD_INGREDIENT_RETURNING = _SQL_ADD_INGREDIENT + " RETURNING id"
+_SQL_ADD_AILMENT_RETURNING = _SQL_ADD_AILMENT + " RETURNING id"
+_SQL_ADD_RECIPE_RETURNING = _SQL_ADD_RECIPE + " RETURNING id"
+_SQL_ADD_SOURCE_RETURNING = _SQL_ADD_SOURCE + " RETURNING id"
+_SQL_ENABLE_SOURCE = "UPDATE sources SET enabled = 1 WHERE id = ?"
+_SQL_DISABLE_SOURCE = "UPDATE sources SET enabled = 0 WHERE id = ?"
+_SQL_UPDATE_SOURCE_SCRAPED = "UPDATE sources SET last_scraped = CURRENT_TIMESTAMP WHERE id = ?"
+_SQL_CREATE_JOB = "INSERT INTO jobs (job_type, query, source_name, status) VALUES (?, ?, ?, 'pending')"
+_SQL_CREATE_JOB_RETURNING = _SQL_CREATE_JOB + " RETURNING id"
+_SQL_GET_JOB = "SELECT * FROM jobs WHERE id = ?"
+_SQL_GET_JOBS_BY_STATUS = "SELECT * FROM jobs WHERE status = ? ORDER BY created_at DESC LIMIT ?"
+_SQL_GET_JOBS = "SELECT * FROM jobs ORDER BY created_at DESC LIMIT ?"
+# Listing only needs what the jobs table renders; skip progress/query blobs
+_SQL_LIST_JOBS = """
+    SELECT id, job_type, status, results_count, created_at
+    FROM jobs ORDER BY created_at DESC LIMIT ?
+"""
+_SQL_UPDATE_JOB_RUNNING = "UPDATE jobs SET status = ?, started_at = CURRENT_TIMESTAMP WHERE id = ?"
+_SQL_UPDATE_JOB_FINISHED = "UPDATE jobs SET status = ?, completed_at = CURRENT_TIMESTAMP, error = ? WHERE id = ?"
+_SQL_UPDATE_JOB_STATUS = "UPDATE jobs SET status = ? WHERE id = ?"
+_SQL_UPDATE_JOB_PROGRESS_COUNT = "UPDATE jobs SET progress = ?, results_count = ? WHERE id = ?"
+_SQL_UPDATE_JOB_PROGRESS = "UPDATE jobs SET progress = ? WHERE id = ?"
+_SQL_ADD_JOB_RESULT = "INSERT INTO job_results (job_id, result_type, result_data) VALUES (?, ?, ?)"
+_SQL_GET_PUBMED_CACHE = """
+    SELECT payload FROM pubmed_cache
+    WHERE query = ? AND max_results = ? AND fetched_at > strftime('%s','now') - ?
+"""
+_SQL_PUT_PUBMED_CACHE = """
+    INSERT OR REPLACE INTO pubmed_cache (query, max_results, fetched_at, payload)
+    VALUES (?, ?, strftime('%s','now'), ?)
+"""
+_SQL_PUBMED_CACHE_SIZE = "SELECT COALESCE(SUM(LENGTH(payload)), 0) FROM pubmed_cache"
+_SQL_TRIM_PUBMED_CACHE = """
+    DELETE FROM pubmed_cache WHERE (query, max_results) IN
+    (SELECT query, max_results FROM pubmed_cache ORDER BY fetched_at ASC LIMIT 20)
+"""
+_SQL_ADD_JOB_RESULT_RETURNING = _SQL_ADD_JOB_RESULT + " RETURNING id"
+_SQL_GET_JOB_RESULTS = "SELECT * FROM job_results WHERE job_id = ? ORDER BY created_at LIMIT ?"
+_SQL_JOURNAL_EVENT = "INSERT INTO journal (job_id, event_type, event_data) VALUES (?, ?, ?)"
+_SQL_GET_JOURNAL_BY_JOB = "SELECT * FROM journal WHERE job_id = ? ORDER BY created_at DESC LIMIT ?"
+_SQL_GET_JOURNAL = "SELECT * FROM journal ORDER BY created_at DESC LIMIT ?"
+_SQL_GET_STATS = """
+    SELECT 'plants', COUNT(*) FROM plants
+    UNION ALL SELECT 'ingredients', COUNT(*) FROM ingredients
+    UNION ALL SELECT 'ailments', COUNT(*) FROM ailments
+    UNION ALL SELECT 'recipes', COUNT(*) FROM recipes
+    UNION ALL SELECT 'sources', COUNT(*) FROM sources
+    UNION ALL SELECT 'jobs', COUNT(*) FROM jobs
+"""
+_SQL_LOG_SEARCH = """
+    INSERT INTO search_history (query, corrected_query, search_type, results_count)
+    VALUES (?, ?, ?, ?)
+"""
+# Substring name suggestions ride the trigram FTS tables (index probes in C)
+# instead of fuzzy-scanning the whole Python-side dictionary.
+_SQL_SUGGEST_NAMES = """
+    SELECT name FROM (
+        SELECT name, rank FROM fts_plants_tri WHERE fts_plants_tri MATCH ?
+        UNION ALL SELECT name, rank FROM fts_ingredients_tri WHERE fts_ingredients_tri MATCH ?
+        UNION ALL SELECT name, rank FROM fts_ailments_tri WHERE fts_ailments_tri MATCH ?
+        UNION ALL SELECT name, rank FROM fts_recipes_tri WHERE fts_recipes_tri MATCH ?
+    ) ORDER BY rank LIMIT ?
+"""
+# lower() runs in C and UNION deduplicates engine-side, so the spellcheck
+# dictionary loads in one round trip without a Python per-row lower() loop.
+_SQL_GET_ALL_NAMES = """
+    SELECT lower(name) FROM plants WHERE name IS NOT NULL
+    UNION SELECT lower(scientific_name) FROM plants WHERE scientific_name IS NOT NULL
+    UNION SELECT lower(name) FROM ingredients WHERE name IS NOT NULL
+    UNION SELECT lower(name) FROM ailments WHERE name IS NOT NULL
+    UNION SELECT lower(name) FROM recipes WHERE name IS NOT NULL
+"""
 
 
 class DatabaseManager:
@@ -14,95 +202,173 @@ class DatabaseManager:
     def __init__(self, db_path: Optional[Path] = None):
         self.db_path = db_path or get_db_path()
         self.conn = init_db(self.db_path)
-    
+        self._tx_depth = 0
+        # Serializes writers: the REPL thread and JobRunner's async worker
+        # share this connection. Reentrant so transaction() blocks can nest.
+        self._write_lock = threading.RLock()
+        # WAL allows many readers alongside the single writer; each thread
+        # gets its own read-only connection so searches never wait on writes.
+        self._local = threading.local()
+        self._readers: List[sqlite3.Connection] = []
+        self._readers_lock = threading.Lock()
+        # name -> id map for get_source_id(); sources change rarely, so this
+        # is built once and dropped when add_source inserts a row
+        self._source_id_cache: Optional[Dict[str, int]] = None
+
+    def _read_conn(self) -> sqlite3.Connection:
+        """Thread-local read-only connection for get_*/search_* queries."""
+        conn = getattr(self._local, 'reader', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, cached_statements=256,
+                                   check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA query_only = 1")
+            conn.execute("PRAGMA busy_timeout = 30000")
+            self._local.reader = conn
+            with self._readers_lock:
+                self._readers.append(conn)
+        return conn
+
     def close(self):
+        self.flush()
+        with self._readers_lock:
+            for conn in self._readers:
+                conn.close()
+            self._readers.clear()
+        self._local = threading.local()
         self.conn.close()
-    
+
+    @contextmanager
+    def transaction(self):
+        """Batch writes into a single transaction.
+
+        Inside the block the per-call commits in add_*/update_* methods become
+        no-ops; everything commits (or rolls back) once on exit. Nesting is
+        allowed - only the outermost block commits. Bulk ingestion (scraper
+        jobs writing thousands of rows) should wrap its loop in this instead
+        of paying an fsync per row.
+        """
+        with self._write_lock:
+            if self._tx_depth == 0:
+                self.conn.execute("BEGIN IMMEDIATE")
+            self._tx_depth += 1
+            try:
+                yield self
+            except BaseException:
+                self._tx_depth -= 1
+                if self._tx_depth == 0:
+                    self.conn.rollback()
+                raise
+            else:
+                self._tx_depth -= 1
+                if self._tx_depth == 0:
+                    self.conn.commit()
+
+    def _maybe_commit(self):
+        """Commit unless a transaction() block is batching writes."""
+        if self._tx_depth == 0:
+            self.conn.commit()
+
+    def _execute_write(self, sql: str, params: Tuple = ()) -> sqlite3.Cursor:
+        """Execute a mutating statement under the write lock and commit."""
+        with self._write_lock:
+            cursor = self.conn.execute(sql, params)
+            self._maybe_commit()
+            return cursor
+
+    def _execute_insert(self, sql: str, params: Tuple = ()) -> int:
+        """Run an INSERT ... RETURNING id statement and return the new id.
+
+        RETURNING reads the id off the statement itself, unlike lastrowid
+        which reflects connection-wide state and is racy when JobRunner's
+        worker thread shares this connection. The row is fetched before the
+        commit, while the statement is still live. On SQLite older than
+        3.35 (no RETURNING) the clause is stripped and lastrowid used
+        instead — safe here because the write lock serializes this
+        connection's inserts.
+        """
+        with self._write_lock:
+            if _HAS_RETURNING:
+                new_id = self.conn.execute(sql, params).fetchone()[0]
+            else:
+                new_id = self.conn.execute(
+                    sql.removesuffix(" RETURNING id"), params).lastrowid
+            self._maybe_commit()
+            return new_id
+
+    def flush(self):
+        """Commit any pending writes immediately."""
+        if self.conn.in_transaction:
+            self.conn.commit()
+
+    def add_plants_bulk(self, rows: List[Tuple]) -> None:
+        """Insert many plants in one transaction via executemany.
+
+        Each row is (name, scientific_name, family, common_names_json,
+        description, taxonomy_id) - the same binding order as add_plant.
+        """
+        with self.transaction():
+            self.conn.executemany(_SQL_ADD_PLANT, rows)
+
     def add_plant(self, name: str, scientific_name: Optional[str] = None, family: Optional[str] = None,
                   common_names: Optional[List] = None, description: Optional[str] = None, 
                   taxonomy_id: Optional[str] = None) -> int:
-        cursor = self.conn.execute("""
-            INSERT INTO plants (name, scientific_name, family, common_names, description, taxonomy_id)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """, (name, scientific_name, family, json.dumps(common_names or []), description, taxonomy_id))
-        self.conn.commit()
-        return cursor.lastrowid
+        return self._execute_insert(_SQL_ADD_PLANT_RETURNING, (name, scientific_name, family, _dump_json(common_names), description, taxonomy_id))
     
     def get_plant(self, plant_id: int) -> Optional[Dict]:
-        row = self.conn.execute("SELECT * FROM plants WHERE id = ?", (plant_id,)).fetchone()
+        row = self._read_conn().execute(_SQL_GET_PLANT, (plant_id,)).fetchone()
         return dict(row) if row else None
     
-    def search_plants(self, query: str, limit: int = 20) -> List[Dict]:
-        rows = self.conn.execute("""
-            SELECT p.* FROM plants p JOIN fts_plants fts ON p.id = fts.rowid
-            WHERE fts_plants MATCH ? ORDER BY rank LIMIT ?
-        """, (query, limit)).fetchall()
+    def search_plants(self, query: str, limit: int = 20, substring: bool = False) -> List[Dict]:
+        # substring=True routes to the trigram FTS table, which matches
+        # anywhere inside a word (query must be >= 3 characters).
+        sql = _SQL_SEARCH_PLANTS_TRI if substring else _SQL_SEARCH_PLANTS
+        rows = self._read_conn().execute(sql, (query, limit)).fetchall()
         return [dict(row) for row in rows]
     
     def add_ingredient(self, name: str, synonyms: Optional[List] = None, cas_number: Optional[str] = None,
                        pubchem_cid: Optional[str] = None, inchi_key: Optional[str] = None, 
                        smiles: Optional[str] = None, molecular_formula: Optional[str] = None, 
                        molecular_weight: Optional[float] = None, description: Optional[str] = None) -> int:
-        cursor = self.conn.execute("""
-            INSERT INTO ingredients (name, synonyms, cas_number, pubchem_cid, inchi_key,
-                                     smiles, molecular_formula, molecular_weight, description)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (name, json.dumps(synonyms or []), cas_number, pubchem_cid, inchi_key,
-              smiles, molecular_formula, molecular_weight, description))
-        self.conn.commit()
-        return cursor.lastrowid
+        return self._execute_insert(_SQL_ADD_INGREDIENT_RETURNING,
+                                   (name, _dump_json(synonyms), cas_number, pubchem_cid, inchi_key,
+                                    smiles, molecular_formula, molecular_weight, description))
     
     def get_ingredient(self, ingredient_id: int) -> Optional[Dict]:
-        row = self.conn.execute("SELECT * FROM ingredients WHERE id = ?", (ingredient_id,)).fetchone()
+        row = self._read_conn().execute(_SQL_GET_INGREDIENT, (ingredient_id,)).fetchone()
         return dict(row) if row else None
     
-    def search_ingredients(self, query: str, limit: int = 20) -> List[Dict]:
-        rows = self.conn.execute("""
-            SELECT i.* FROM ingredients i JOIN fts_ingredients fts ON i.id = fts.rowid
-            WHERE fts_ingredients MATCH ? ORDER BY rank LIMIT ?
-        """, (query, limit)).fetchall()
+    def search_ingredients(self, query: str, limit: int = 20, substring: bool = False) -> List[Dict]:
+        sql = _SQL_SEARCH_INGREDIENTS_TRI if substring else _SQL_SEARCH_INGREDIENTS
+        rows = self._read_conn().execute(sql, (query, limit)).fetchall()
         return [dict(row) for row in rows]
     
     def add_ailment(self, name: str, synonyms: Optional[List] = None, icd10_code: Optional[str] = None,
                     mesh_id: Optional[str] = None, category: Optional[str] = None, 
                     description: Optional[str] = None) -> int:
-        cursor = self.conn.execute("""
-            INSERT INTO ailments (name, synonyms, icd10_code, mesh_id, category, description)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """, (name, json.dumps(synonyms or []), icd10_code, mesh_id, category, description))
-        self.conn.commit()
-        return cursor.lastrowid
+        return self._execute_insert(_SQL_ADD_AILMENT_RETURNING, (name, _dump_json(synonyms), icd10_code, mesh_id, category, description))
     
     def get_ailment(self, ailment_id: int) -> Optional[Dict]:
-        row = self.conn.execute("SELECT * FROM ailments WHERE id = ?", (ailment_id,)).fetchone()
+        row = self._read_conn().execute(_SQL_GET_AILMENT, (ailment_id,)).fetchone()
         return dict(row) if row else None
     
-    def search_ailments(self, query: str, limit: int = 20) -> List[Dict]:
-        rows = self.conn.execute("""
-            SELECT a.* FROM ailments a JOIN fts_ailments fts ON a.id = fts.rowid
-            WHERE fts_ailments MATCH ? ORDER BY rank LIMIT ?
-        """, (query, limit)).fetchall()
+    def search_ailments(self, query: str, limit: int = 20, substring: bool = False) -> List[Dict]:
+        sql = _SQL_SEARCH_AILMENTS_TRI if substring else _SQL_SEARCH_AILMENTS
+        rows = self._read_conn().execute(sql, (query, limit)).fetchall()
         return [dict(row) for row in rows]
     
     def add_recipe(self, name: str, tradition: Optional[str] = None, description: Optional[str] = None,
                    preparation: Optional[str] = None, dosage: Optional[str] = None, 
                    source_id: Optional[int] = None) -> int:
-        cursor = self.conn.execute("""
-            INSERT INTO recipes (name, tradition, description, preparation, dosage, source_id)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """, (name, tradition, description, preparation, dosage, source_id))
-        self.conn.commit()
-        return cursor.lastrowid
+        return self._execute_insert(_SQL_ADD_RECIPE_RETURNING, (name, tradition, description, preparation, dosage, source_id))
     
     def get_recipe(self, recipe_id: int) -> Optional[Dict]:
-        row = self.conn.execute("SELECT * FROM recipes WHERE id = ?", (recipe_id,)).fetchone()
+        row = self._read_conn().execute(_SQL_GET_RECIPE, (recipe_id,)).fetchone()
         return dict(row) if row else None
     
-    def search_recipes(self, query: str, limit: int = 20) -> List[Dict]:
-        rows = self.conn.execute("""
-            SELECT r.* FROM recipes r JOIN fts_recipes fts ON r.id = fts.rowid
-            WHERE fts_recipes MATCH ? ORDER BY rank LIMIT ?
-        """, (query, limit)).fetchall()
+    def search_recipes(self, query: str, limit: int = 20, substring: bool = False) -> List[Dict]:
+        sql = _SQL_SEARCH_RECIPES_TRI if substring else _SQL_SEARCH_RECIPES
+        rows = self._read_conn().execute(sql, (query, limit)).fetchall()
         return [dict(row) for row in rows]
     
     def get_sources(self, enabled_only: bool = False) -> List[Dict]:
@@ -110,112 +376,229 @@ class DatabaseManager:
         if enabled_only:
             query += " WHERE enabled = 1"
         query += " ORDER BY priority DESC"
-        rows = self.conn.execute(query).fetchall()
+        rows = self._read_conn().execute(query).fetchall()
         return [dict(row) for row in rows]
     
+    def get_source_id(self, name: str) -> Optional[int]:
+        """O(1) source name lookup; avoids re-querying sources per scraper."""
+        cache = self._source_id_cache
+        if cache is None:
+            cache = {s['name']: s['id'] for s in self.get_sources()}
+            self._source_id_cache = cache
+        return cache.get(name)
+    
     def add_source(self, name: str, url: str, source_type: str = "manual",
                    priority: int = 50, config: Optional[Dict] = None) -> int:
-        cursor = self.conn.execute("""
-            INSERT INTO sources (name, url, source_type, priority, enabled, config)
-            VALUES (?, ?, ?, ?, 1, ?)
-        """, (name, url, source_type, priority, json.dumps(config or {})))
-        self.conn.commit()
-        return cursor.lastrowid
+        source_id = self._execute_insert(_SQL_ADD_SOURCE_RETURNING, (name, url, source_type, priority, _dump_json(config)))
+        self._source_id_cache = None
+        return source_id
     
     def enable_source(self, source_id: int):
-        self.conn.execute("UPDATE sources SET enabled = 1 WHERE id = ?", (source_id,))
-        self.conn.commit()
+        self._execute_write(_SQL_ENABLE_SOURCE, (source_id,))
     
     def disable_source(self, source_id: int):
-        self.conn.execute("UPDATE sources SET enabled = 0 WHERE id = ?", (source_id,))
-        self.conn.commit()
+        self._execute_write(_SQL_DISABLE_SOURCE, (source_id,))
     
     def update_source_scraped(self, source_id: int):
-        self.conn.execute("UPDATE sources SET last_scraped = ? WHERE id = ?",
-                         (datetime.now().isoformat(), source_id))
-        self.conn.commit()
+        # Timestamps come from SQLite's own clock (CURRENT_TIMESTAMP); no
+        # per-call datetime construction or ISO formatting in Python.
+        self._execute_write(_SQL_UPDATE_SOURCE_SCRAPED, (source_id,))
     
-    def create_job(self, job_type: str, query: Optional[Dict] = None) -> int:
-        cursor = self.conn.execute("""
-            INSERT INTO jobs (job_type, query, status) VALUES (?, ?, 'pending')
-        """, (job_type, json.dumps(query or {})))
-        self.conn.commit()
-        return cursor.lastrowid
+    def create_job(self, job_type: str, query: Optional[Dict] = None,
+                   source_name: Optional[str] = None) -> int:
+        return self._execute_insert(_SQL_CREATE_JOB_RETURNING,
+                                    (job_type, _dump_json(query), source_name))
     
+    @staticmethod
+    def _job_row_to_dict(row) -> Dict:
+        # Decode the JSON query column once at read time so every caller
+        # gets a dict (or None) and nobody re-runs json.loads per access.
+        job = dict(row)
+        query = job.get('query')
+        if isinstance(query, (str, bytes)):
+            try:
+                job['query'] = _load_json(query)
+            except ValueError:
+                pass
+        return job
+
     def get_job(self, job_id: int) -> Optional[Dict]:
-        row = self.conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
-        return dict(row) if row else None
+        row = self._read_conn().execute(_SQL_GET_JOB, (job_id,)).fetchone()
+        return self._job_row_to_dict(row) if row else None
     
-    def get_jobs(self, status: Optional[str] = None) -> List[Dict]:
+    def get_jobs(self, status: Optional[str] = None, limit: int = 100) -> List[Dict]:
         if status:
-            rows = self.conn.execute("SELECT * FROM jobs WHERE status = ? ORDER BY created_at DESC", (status,)).fetchall()
+            rows = self._read_conn().execute(_SQL_GET_JOBS_BY_STATUS, (status, limit)).fetchall()
         else:
-            rows = self.conn.execute("SELECT * FROM jobs ORDER BY created_at DESC").fetchall()
+            rows = self._read_conn().execute(_SQL_GET_JOBS, (limit,)).fetchall()
+        return [self._job_row_to_dict(row) for row in rows]
+
+    def list_jobs(self, limit: int = 20) -> List[Dict]:
+        """Newest jobs with only the columns the listing UI renders."""
+        rows = self._read_conn().execute(_SQL_LIST_JOBS, (limit,)).fetchall()
         return [dict(row) for row in rows]
     
     def update_job_status(self, job_id: int, status: str, error: Optional[str] = None):
         if status == 'running':
-            self.conn.execute("UPDATE jobs SET status = ?, started_at = ? WHERE id = ?",
-                            (status, datetime.now().isoformat(), job_id))
+            self._execute_write(_SQL_UPDATE_JOB_RUNNING, (status, job_id))
         elif status in ('completed', 'failed'):
-            self.conn.execute("UPDATE jobs SET status = ?, completed_at = ?, error = ? WHERE id = ?",
-                            (status, datetime.now().isoformat(), error, job_id))
+            self._execute_write(_SQL_UPDATE_JOB_FINISHED, (status, error, job_id))
         else:
-            self.conn.execute("UPDATE jobs SET status = ? WHERE id = ?", (status, job_id))
-        self.conn.commit()
+            self._execute_write(_SQL_UPDATE_JOB_STATUS, (status, job_id))
     
     def update_job_progress(self, job_id: int, progress: Dict, results_count: Optional[int] = None):
         if results_count is not None:
-            self.conn.execute("UPDATE jobs SET progress = ?, results_count = ? WHERE id = ?",
-                            (json.dumps(progress), results_count, job_id))
+            self._execute_write(_SQL_UPDATE_JOB_PROGRESS_COUNT,
+                            (_dump_json(progress), results_count, job_id))
         else:
-            self.conn.execute("UPDATE jobs SET progress = ? WHERE id = ?", (json.dumps(progress), job_id))
-        self.conn.commit()
+            self._execute_write(_SQL_UPDATE_JOB_PROGRESS, (_dump_json(progress), job_id))
     
     def add_job_result(self, job_id: int, result_type: str, result_data: Dict) -> int:
-        cursor = self.conn.execute("""
-            INSERT INTO job_results (job_id, result_type, result_data) VALUES (?, ?, ?)
-        """, (job_id, result_type, json.dumps(result_data)))
-        self.conn.commit()
-        return cursor.lastrowid
+        return self._execute_insert(_SQL_ADD_JOB_RESULT_RETURNING, (job_id, result_type, _dump_json(result_data)))
     
+    def add_job_results_bulk(self, job_id: int, results: List[Tuple[str, Dict]]) -> None:
+        """Insert many (result_type, result_data) rows under one commit.
+
+        Scrapers buffer per-record results and flush them here so ingestion
+        pays one fsync per batch instead of one per row.
+        """
+        with self.transaction():
+            self.conn.executemany(
+                _SQL_ADD_JOB_RESULT,
+                [(job_id, result_type, _dump_json(data)) for result_type, data in results])
+
     def get_job_results(self, job_id: int, limit: int = 100) -> List[Dict]:
-        rows = self.conn.execute("SELECT * FROM job_results WHERE job_id = ? ORDER BY created_at LIMIT ?",
+        rows = self._read_conn().execute(_SQL_GET_JOB_RESULTS,
                                 (job_id, limit)).fetchall()
         return [dict(row) for row in rows]
     
     def journal_event(self, event_type: str, event_data: Optional[Dict] = None, job_id: Optional[int] = None):
-        self.conn.execute("INSERT INTO journal (job_id, event_type, event_data) VALUES (?, ?, ?)",
-                         (job_id, event_type, json.dumps(event_data or {})))
-        self.conn.commit()
+        self._execute_write(_SQL_JOURNAL_EVENT,
+                         (job_id, event_type, _dump_json(event_data)))
     
+    def get_plant_summary(self, plant_id: int) -> Optional[PlantSummary]:
+        """Fetch id/name columns only - no sqlite3.Row, no dict, no blobs.
+
+        The full get_plant stays for callers that display every field; these
+        summary getters exist for hot paths that just need identity, where
+        SELECT * would drag description and JSON columns across the boundary
+        and pay a dict build per row.
+        """
+        row = self._read_conn().execute(
+            "SELECT id, name, scientific_name FROM plants WHERE id = ?", (plant_id,)).fetchone()
+        return PlantSummary(*tuple(row)) if row else None
+
+    def get_ingredient_summary(self, ingredient_id: int) -> Optional[IngredientSummary]:
+        row = self._read_conn().execute(
+            "SELECT id, name, molecular_formula FROM ingredients WHERE id = ?", (ingredient_id,)).fetchone()
+        return IngredientSummary(*tuple(row)) if row else None
+
+    def get_ailment_summary(self, ailment_id: int) -> Optional[AilmentSummary]:
+        row = self._read_conn().execute(
+            "SELECT id, name, category FROM ailments WHERE id = ?", (ailment_id,)).fetchone()
+        return AilmentSummary(*tuple(row)) if row else None
+
+    def get_recipe_summary(self, recipe_id: int) -> Optional[RecipeSummary]:
+        row = self._read_conn().execute(
+            "SELECT id, name, tradition FROM recipes WHERE id = ?", (recipe_id,)).fetchone()
+        return RecipeSummary(*tuple(row)) if row else None
+
+    def get_latest_event(self, job_id: int, event_types: Tuple[str, ...]) -> Optional[str]:
+        """Return the raw event_data of the newest matching journal entry.
+
+        Lets recovery code fetch exactly one row (via idx_journal_job_created)
+        instead of pulling a page of events and JSON-decoding each in Python.
+        """
+        placeholders = ','.join('?' * len(event_types))
+        row = self._read_conn().execute(
+            f"SELECT event_data FROM journal WHERE job_id = ? AND event_type IN ({placeholders}) "
+            "ORDER BY created_at DESC LIMIT 1",
+            (job_id, *event_types)).fetchone()
+        return row[0] if row else None
+
+    def iter_journal_timeline(self, job_id: int, limit: int = 1000) -> Iterator[Tuple]:
+        """Yield (event_type, event_data, created_at) oldest-first for a job."""
+        # id breaks created_at ties (second granularity) so events within
+        # the same second still come back in insertion order
+        cursor = self._read_conn().execute(
+            "SELECT event_type, event_data, created_at FROM journal "
+            "WHERE job_id = ? ORDER BY created_at ASC, id ASC LIMIT ?",
+            (job_id, limit))
+        yield from cursor
+
+    def count_journal_events(self, job_id: int) -> Dict[str, int]:
+        """Event counts grouped by type, aggregated in SQL."""
+        return dict(self._read_conn().execute(
+            "SELECT event_type, COUNT(*) FROM journal WHERE job_id = ? GROUP BY event_type",
+            (job_id,)).fetchall())
+
+    def iter_journal_error_data(self, job_id: int) -> Iterator[Optional[str]]:
+        """Yield the raw event_data of each error event for a job."""
+        cursor = self._read_conn().execute(
+            "SELECT event_data FROM journal WHERE job_id = ? AND event_type = 'error'",
+            (job_id,))
+        for row in cursor:
+            yield row[0]
+
+    def get_journal_bounds(self, job_id: int) -> Tuple[Optional[str], Optional[str]]:
+        """Return (first start, last terminal event) timestamps for a job."""
+        return self._read_conn().execute("""
+            SELECT MIN(CASE WHEN event_type = 'start' THEN created_at END),
+                   MAX(CASE WHEN event_type IN ('complete', 'error', 'paused') THEN created_at END)
+            FROM journal WHERE job_id = ?
+        """, (job_id,)).fetchone()
+
     def get_journal(self, job_id: Optional[int] = None, limit: int = 100) -> List[Dict]:
         if job_id:
-            rows = self.conn.execute("SELECT * FROM journal WHERE job_id = ? ORDER BY created_at DESC LIMIT ?",
+            rows = self._read_conn().execute(_SQL_GET_JOURNAL_BY_JOB,
                                     (job_id, limit)).fetchall()
         else:
-            rows = self.conn.execute("SELECT * FROM journal ORDER BY created_at DESC LIMIT ?", (limit,)).fetchall()
+            rows = self._read_conn().execute(_SQL_GET_JOURNAL, (limit,)).fetchall()
         return [dict(row) for row in rows]
     
     def log_search(self, query: str, corrected_query: Optional[str] = None, 
                    search_type: Optional[str] = None, results_count: int = 0):
-        self.conn.execute("""
-            INSERT INTO search_history (query, corrected_query, search_type, results_count)
-            VALUES (?, ?, ?, ?)
-        """, (query, corrected_query, search_type, results_count))
-        self.conn.commit()
+        self._execute_write(_SQL_LOG_SEARCH, (query, corrected_query, search_type, results_count))
     
+    def get_cached_pubmed(self, query: str, max_results: int,
+                          ttl: int = 86400) -> Optional[List[Dict]]:
+        row = self._read_conn().execute(_SQL_GET_PUBMED_CACHE,
+                                        (query, max_results, ttl)).fetchone()
+        if row is None:
+            return None
+        try:
+            return json.loads(zlib.decompress(row[0]))
+        except (zlib.error, json.JSONDecodeError, TypeError):
+            return None
+
+    def cache_pubmed(self, query: str, max_results: int, results: List[Dict],
+                     max_bytes: int = 5 * 1024 * 1024):
+        payload = zlib.compress(json.dumps(results).encode(), 1)
+        with self.transaction():
+            self.conn.execute(_SQL_PUT_PUBMED_CACHE, (query, max_results, payload))
+            # Evict oldest entries until the cache fits the size budget
+            while self.conn.execute(_SQL_PUBMED_CACHE_SIZE).fetchone()[0] > max_bytes:
+                if self.conn.execute(_SQL_TRIM_PUBMED_CACHE).rowcount == 0:
+                    break
+
     def get_stats(self) -> Dict:
-        stats = {}
-        for table in ['plants', 'ingredients', 'ailments', 'recipes', 'sources', 'jobs']:
-            row = self.conn.execute(f"SELECT COUNT(*) as count FROM {table}").fetchone()
-            stats[table] = row['count']
-        return stats
+        rows = self._read_conn().execute(_SQL_GET_STATS).fetchall()
+        return {row[0]: row[1] for row in rows}
     
+    def suggest_names(self, fragment: str, limit: int = 5) -> List[str]:
+        """Names containing ``fragment`` as a substring, best-ranked first.
+
+        Trigram matching needs at least three characters; shorter fragments
+        return nothing and callers should fall back to fuzzy matching.
+        """
+        fragment = fragment.strip()
+        if len(fragment) < 3:
+            return []
+        match = 'name : "{}"'.format(fragment.replace('"', '""'))
+        rows = self._read_conn().execute(
+            _SQL_SUGGEST_NAMES, (match, match, match, match, limit)).fetchall()
+        return [row[0] for row in rows]
+
     def get_all_names(self) -> Set[str]:
-        names = set()
-        for table, col in [('plants', 'name'), ('plants', 'scientific_name'),
-                           ('ingredients', 'name'), ('ailments', 'name'), ('recipes', 'name')]:
-            rows = self.conn.execute(f"SELECT {col} FROM {table} WHERE {col} IS NOT NULL").fetchall()
-            names.update(row[0].lower() for row in rows)
-        return names
+        rows = self._read_conn().execute(_SQL_GET_ALL_NAMES)
+        return {row[0] for row in rows}
@@ -1,8 +1,19 @@
 """SQLite database schema for Grimmoire."""
-import sqlite3
 from pathlib import Path
+
+# pysqlite3-binary bundles a newer SQLite than most system Pythons (better
+# FTS5/JSON1, lower per-call overhead); it is a drop-in sqlite3 replacement,
+# so prefer it when installed and fall back to the stdlib module.
+try:
+    import pysqlite3 as sqlite3  # type: ignore[import-not-found]
+except ImportError:
+    import sqlite3
 from typing import Optional
 
+# Bump whenever SCHEMA changes; init_db reruns the (idempotent) DDL script
+# only when a database's user_version is older than this.
+SCHEMA_VERSION = 6
+
 SCHEMA = """
 -- Core entities
 CREATE TABLE IF NOT EXISTS plants (
@@ -123,6 +134,7 @@ CREATE TABLE IF NOT EXISTS jobs (
     job_type TEXT NOT NULL,
     status TEXT DEFAULT 'pending',
     query TEXT,
+    source_name TEXT,
     progress TEXT,
     results_count INTEGER DEFAULT 0,
     error TEXT,
@@ -131,6 +143,9 @@ CREATE TABLE IF NOT EXISTS jobs (
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
+CREATE INDEX IF NOT EXISTS idx_jobs_status_created ON jobs(status, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_jobs_created ON jobs(created_at DESC);
+
 CREATE TABLE IF NOT EXISTS job_results (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     job_id INTEGER NOT NULL,
@@ -139,6 +154,7 @@ CREATE TABLE IF NOT EXISTS job_results (
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     FOREIGN KEY (job_id) REFERENCES jobs(id)
 );
+CREATE INDEX IF NOT EXISTS idx_job_results_job ON job_results(job_id, created_at);
 
 CREATE TABLE IF NOT EXISTS journal (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -148,67 +164,119 @@ CREATE TABLE IF NOT EXISTS journal (
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     FOREIGN KEY (job_id) REFERENCES jobs(id)
 );
+CREATE INDEX IF NOT EXISTS idx_journal_job_created ON journal(job_id, created_at DESC);
+
+-- Cached PubMed responses (compressed JSON payloads, TTL-checked on read)
+CREATE TABLE IF NOT EXISTS pubmed_cache (
+    query TEXT NOT NULL,
+    max_results INTEGER NOT NULL,
+    fetched_at INTEGER NOT NULL,
+    payload BLOB,
+    PRIMARY KEY (query, max_results)
+);
 
--- Full-text search
+-- Full-text search. The unicode61 tables handle token/prefix queries with
+-- diacritics folded (matricaria == matricária); the *_tri trigram tables
+-- serve substring queries (>= 3 chars) that token FTS cannot.
 CREATE VIRTUAL TABLE IF NOT EXISTS fts_plants USING fts5(
     name, scientific_name, common_names, description,
-    content='plants', content_rowid='id'
+    content='plants', content_rowid='id', tokenize='unicode61 remove_diacritics 2',
+    prefix='2 3 4'
 );
 
 CREATE VIRTUAL TABLE IF NOT EXISTS fts_ingredients USING fts5(
     name, synonyms, description,
-    content='ingredients', content_rowid='id'
+    content='ingredients', content_rowid='id', tokenize='unicode61 remove_diacritics 2',
+    prefix='2 3 4'
 );
 
 CREATE VIRTUAL TABLE IF NOT EXISTS fts_ailments USING fts5(
     name, synonyms, description,
-    content='ailments', content_rowid='id'
+    content='ailments', content_rowid='id', tokenize='unicode61 remove_diacritics 2',
+    prefix='2 3 4'
 );
 
 CREATE VIRTUAL TABLE IF NOT EXISTS fts_recipes USING fts5(
     name, description, preparation,
-    content='recipes', content_rowid='id'
+    content='recipes', content_rowid='id', tokenize='unicode61 remove_diacritics 2',
+    prefix='2 3 4'
+);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS fts_plants_tri USING fts5(
+    name, scientific_name, common_names, description,
+    content='plants', content_rowid='id', tokenize='trigram'
+);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS fts_ingredients_tri USING fts5(
+    name, synonyms, description,
+    content='ingredients', content_rowid='id', tokenize='trigram'
+);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS fts_ailments_tri USING fts5(
+    name, synonyms, description,
+    content='ailments', content_rowid='id', tokenize='trigram'
+);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS fts_recipes_tri USING fts5(
+    name, description, preparation,
+    content='recipes', content_rowid='id', tokenize='trigram'
 );
 
 -- Triggers to keep FTS in sync
 CREATE TRIGGER IF NOT EXISTS plants_ai AFTER INSERT ON plants BEGIN
     INSERT INTO fts_plants(rowid, name, scientific_name, common_names, description)
     VALUES (new.id, new.name, new.scientific_name, new.common_names, new.description);
+    INSERT INTO fts_plants_tri(rowid, name, scientific_name, common_names, description)
+    VALUES (new.id, new.name, new.scientific_name, new.common_names, new.description);
 END;
 
 CREATE TRIGGER IF NOT EXISTS plants_ad AFTER DELETE ON plants BEGIN
     INSERT INTO fts_plants(fts_plants, rowid, name, scientific_name, common_names, description)
     VALUES ('delete', old.id, old.name, old.scientific_name, old.common_names, old.description);
+    INSERT INTO fts_plants_tri(fts_plants_tri, rowid, name, scientific_name, common_names, description)
+    VALUES ('delete', old.id, old.name, old.scientific_name, old.common_names, old.description);
 END;
 
 CREATE TRIGGER IF NOT EXISTS ingredients_ai AFTER INSERT ON ingredients BEGIN
     INSERT INTO fts_ingredients(rowid, name, synonyms, description)
     VALUES (new.id, new.name, new.synonyms, new.description);
+    INSERT INTO fts_ingredients_tri(rowid, name, synonyms, description)
+    VALUES (new.id, new.name, new.synonyms, new.description);
 END;
 
 CREATE TRIGGER IF NOT EXISTS ingredients_ad AFTER DELETE ON ingredients BEGIN
     INSERT INTO fts_ingredients(fts_ingredients, rowid, name, synonyms, description)
     VALUES ('delete', old.id, old.name, old.synonyms, old.description);
+    INSERT INTO fts_ingredients_tri(fts_ingredients_tri, rowid, name, synonyms, description)
+    VALUES ('delete', old.id, old.name, old.synonyms, old.description);
 END;
 
 CREATE TRIGGER IF NOT EXISTS ailments_ai AFTER INSERT ON ailments BEGIN
     INSERT INTO fts_ailments(rowid, name, synonyms, description)
     VALUES (new.id, new.name, new.synonyms, new.description);
+    INSERT INTO fts_ailments_tri(rowid, name, synonyms, description)
+    VALUES (new.id, new.name, new.synonyms, new.description);
 END;
 
 CREATE TRIGGER IF NOT EXISTS ailments_ad AFTER DELETE ON ailments BEGIN
     INSERT INTO fts_ailments(fts_ailments, rowid, name, synonyms, description)
     VALUES ('delete', old.id, old.name, old.synonyms, old.description);
+    INSERT INTO fts_ailments_tri(fts_ailments_tri, rowid, name, synonyms, description)
+    VALUES ('delete', old.id, old.name, old.synonyms, old.description);
 END;
 
 CREATE TRIGGER IF NOT EXISTS recipes_ai AFTER INSERT ON recipes BEGIN
     INSERT INTO fts_recipes(rowid, name, description, preparation)
     VALUES (new.id, new.name, new.description, new.preparation);
+    INSERT INTO fts_recipes_tri(rowid, name, description, preparation)
+    VALUES (new.id, new.name, new.description, new.preparation);
 END;
 
 CREATE TRIGGER IF NOT EXISTS recipes_ad AFTER DELETE ON recipes BEGIN
     INSERT INTO fts_recipes(fts_recipes, rowid, name, description, preparation)
     VALUES ('delete', old.id, old.name, old.description, old.preparation);
+    INSERT INTO fts_recipes_tri(fts_recipes_tri, rowid, name, description, preparation)
+    VALUES ('delete', old.id, old.name, old.description, old.preparation);
 END;
 
 -- Search history
@@ -248,18 +316,66 @@ def init_db(db_path: Optional[Path] = None) -> sqlite3.Connection:
     if db_path is None:
         db_path = get_db_path()
     
-    conn = sqlite3.connect(db_path)
+    # Larger statement cache so the fixed SQL strings in manager.py stay
+    # compiled; check_same_thread off because JobRunner writes from a worker
+    # thread (DatabaseManager serializes writes with a lock).
+    conn = sqlite3.connect(db_path, cached_statements=256, check_same_thread=False)
     conn.row_factory = sqlite3.Row
     conn.execute("PRAGMA foreign_keys = ON")
+    # NOTE: WAL relies on shared-memory coordination and is unsafe on network
+    # filesystems (NFS/SMB); point --db at local storage, or switch this to
+    # journal_mode=TRUNCATE if the database must live on a network mount.
     conn.execute("PRAGMA journal_mode = WAL")
+    # WAL makes synchronous=NORMAL safe (no torn commits, at most a lost
+    # last-commit on power failure) and roughly halves fsync cost per commit.
+    conn.execute("PRAGMA synchronous = NORMAL")
+    conn.execute("PRAGMA busy_timeout = 30000")
+    conn.execute("PRAGMA cache_size = -65536")  # 64 MiB page cache
+    conn.execute("PRAGMA temp_store = MEMORY")
+    conn.execute("PRAGMA mmap_size = 268435456")  # 256 MiB
+    conn.execute("PRAGMA wal_autocheckpoint = 1000")
     
-    conn.executescript(SCHEMA)
-    
-    for source in DEFAULT_SOURCES:
-        conn.execute("""
+    # Reparsing ~30 CREATE statements on every open costs tens of ms for a
+    # CLI; skip the DDL entirely once a database is stamped current.
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    if version < SCHEMA_VERSION:
+        if version < 5:
+            # v5 denormalized the scrape source out of the query JSON so
+            # listing/resume paths don't parse JSON per row. Databases from
+            # before versioning report user_version 0, so 0 must migrate too;
+            # the column check keeps this idempotent, and an empty cols list
+            # means a fresh file where the DDL below creates jobs correctly.
+            cols = [row[1] for row in conn.execute("PRAGMA table_info(jobs)")]
+            if cols and 'source_name' not in cols:
+                conn.execute("ALTER TABLE jobs ADD COLUMN source_name TEXT")
+                conn.execute(
+                    "UPDATE jobs SET source_name = json_extract(query, '$.source') "
+                    "WHERE source_name IS NULL AND query IS NOT NULL")
+        if version < 3:
+            # v2 changed the FTS tokenizers and added the *_tri shadow tables;
+            # v3 added prefix indexes. Drop the old FTS tables and sync
+            # triggers so the DDL below recreates them with the new
+            # definitions. Pre-versioning databases (user_version 0) carry
+            # the old definitions too and the DDL is all IF NOT EXISTS, so
+            # they must take this path; on a fresh file every DROP is a no-op.
+            for table in ('fts_plants', 'fts_ingredients', 'fts_ailments', 'fts_recipes'):
+                conn.execute(f"DROP TABLE IF EXISTS {table}")
+            for prefix in ('plants', 'ingredients', 'ailments', 'recipes'):
+                conn.execute(f"DROP TRIGGER IF EXISTS {prefix}_ai")
+                conn.execute(f"DROP TRIGGER IF EXISTS {prefix}_ad")
+        conn.executescript(SCHEMA)
+
+        # External-content FTS tables start empty; repopulate them from their
+        # content tables. No-op (fast) on a fresh database.
+        for table in ('fts_plants', 'fts_ingredients', 'fts_ailments', 'fts_recipes',
+                      'fts_plants_tri', 'fts_ingredients_tri', 'fts_ailments_tri', 'fts_recipes_tri'):
+            conn.execute(f"INSERT INTO {table}({table}) VALUES('rebuild')")
+
+        conn.executemany("""
             INSERT OR IGNORE INTO sources (name, url, source_type, priority, enabled, config)
             VALUES (?, ?, ?, ?, ?, ?)
-        """, source)
-    
-    conn.commit()
+        """, DEFAULT_SOURCES)
+
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        conn.commit()
     return conn
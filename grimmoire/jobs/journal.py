@@ -1,6 +1,6 @@
 """Journal management for tracking job history and recovery."""
 import json
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Iterator
 from datetime import datetime
 
 from ..db.manager import DatabaseManager
@@ -16,74 +16,68 @@ class Journal:
         self.db.journal_event(event_type, data or {}, job_id)
     
     def get_last_checkpoint(self, job_id: int) -> Optional[Dict]:
-        events = self.db.get_journal(job_id, limit=50)
-        for event in events:
-            if event['event_type'] == 'progress':
-                try:
-                    return json.loads(event['event_data'])
-                except (json.JSONDecodeError, TypeError):
-                    pass
+        event_data = self.db.get_latest_event(job_id, ('progress',))
+        if event_data:
+            try:
+                return json.loads(event_data)
+            except (json.JSONDecodeError, TypeError):
+                pass
         return None
-    
+
     def get_recovery_point(self, job_id: int) -> Optional[Dict]:
-        events = self.db.get_journal(job_id, limit=100)
-        for event in events:
-            if event['event_type'] in ('progress', 'paused', 'resume'):
-                try:
-                    data = json.loads(event['event_data'])
-                    if 'from_progress' in data:
-                        return data['from_progress']
-                    return data
-                except (json.JSONDecodeError, TypeError):
-                    pass
+        event_data = self.db.get_latest_event(job_id, ('progress', 'paused', 'resume'))
+        if event_data:
+            try:
+                data = json.loads(event_data)
+                if 'from_progress' in data:
+                    return data['from_progress']
+                return data
+            except (json.JSONDecodeError, TypeError):
+                pass
         return None
     
-    def get_job_timeline(self, job_id: int) -> List[Dict]:
-        events = self.db.get_journal(job_id, limit=1000)
-        timeline = []
-        for event in reversed(events):
+    def iter_job_timeline(self, job_id: int, limit: int = 1000) -> Iterator[Dict]:
+        """Yield timeline events oldest-first, decoding JSON one row at a time.
+
+        Ordering ASC in SQL avoids materializing and reversing the whole
+        event list in Python; callers that stop early never pay for the rest.
+        """
+        for event_type, event_data, created_at in self.db.iter_journal_timeline(job_id, limit):
             try:
-                data = json.loads(event['event_data']) if event['event_data'] else {}
+                data = json.loads(event_data) if event_data else {}
             except (json.JSONDecodeError, TypeError):
                 data = {}
-            timeline.append({'time': event['created_at'], 'event': event['event_type'], 'data': data})
-        return timeline
+            yield {'time': created_at, 'event': event_type, 'data': data}
+
+    def get_job_timeline(self, job_id: int) -> List[Dict]:
+        return list(self.iter_job_timeline(job_id))
     
     def summarize_job(self, job_id: int) -> Dict:
-        events = self.db.get_journal(job_id)
         job = self.db.get_job(job_id)
-        
+
+        # Aggregate in SQL so memory stays O(distinct event types) instead of
+        # loading (and JSON-decoding) every journal row for the job.
+        counts = self.db.count_journal_events(job_id)
+
         summary = {
             'job_id': job_id,
             'status': job['status'] if job else 'unknown',
-            'total_events': len(events),
+            'total_events': sum(counts.values()),
             'errors': [],
-            'interrupts': 0,
-            'resumes': 0,
+            'interrupts': counts.get('interrupt_requested', 0),
+            'resumes': counts.get('resume', 0),
             'duration': None
         }
-        
-        start_time = None
-        end_time = None
-        
-        for event in events:
-            event_type = event['event_type']
+
+        for event_data in self.db.iter_journal_error_data(job_id):
             try:
-                data = json.loads(event['event_data']) if event['event_data'] else {}
+                data = json.loads(event_data) if event_data else {}
             except (json.JSONDecodeError, TypeError):
                 data = {}
-            
-            if event_type == 'start' and not start_time:
-                start_time = event['created_at']
-            elif event_type in ('complete', 'error', 'paused'):
-                end_time = event['created_at']
-            elif event_type == 'error':
-                summary['errors'].append(data.get('error', 'Unknown error'))
-            elif event_type == 'interrupt_requested':
-                summary['interrupts'] += 1
-            elif event_type == 'resume':
-                summary['resumes'] += 1
-        
+            summary['errors'].append(data.get('error', 'Unknown error'))
+
+        start_time, end_time = self.db.get_journal_bounds(job_id)
+
         if start_time and end_time:
             try:
                 start = datetime.fromisoformat(start_time)
@@ -91,7 +85,7 @@ class Journal:
                 summary['duration'] = str(end - start)
             except ValueError:
                 pass
-        
+
         return summary
     
     def clear_old_entries(self, days: int = 30):
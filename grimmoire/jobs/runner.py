@@ -3,7 +3,6 @@ import json
 import signal
 import threading
 import time
-from datetime import datetime
 from typing import Callable, Optional, Any, List, Dict
 from dataclasses import dataclass
 from enum import Enum
@@ -27,6 +26,9 @@ class JobContext:
     db: DatabaseManager
     progress_callback: Callable
     should_stop: Callable[[], bool]
+    # Flush a buffered batch of (result_type, result_data) pairs in one
+    # transaction; jobs should accumulate ~1000 results between calls.
+    flush_results: Callable[[List[tuple]], None] = lambda batch: None
 
 
 class JobRunner:
@@ -35,11 +37,10 @@ class JobRunner:
     def __init__(self, db: DatabaseManager):
         self.db = db
         self.current_job_id: Optional[int] = None
-        self.stop_requested = False
-        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
         self._running_thread: Optional[threading.Thread] = None
         self._setup_signal_handlers()
-    
+
     def _setup_signal_handlers(self):
         def handler(signum, frame):
             self.request_stop()
@@ -48,20 +49,29 @@ class JobRunner:
             signal.signal(signal.SIGTERM, handler)
         except ValueError:
             pass
-    
+
     def request_stop(self):
-        with self._lock:
-            self.stop_requested = True
-            if self.current_job_id:
-                self.db.journal_event('interrupt_requested', {'reason': 'user_interrupt'}, self.current_job_id)
-    
+        # Only flip the event here: this runs inside a signal handler, where
+        # taking locks or writing to the DB could deadlock. The journal write
+        # happens on a short-lived worker thread instead.
+        self._stop_event.set()
+        job_id = self.current_job_id
+        if job_id:
+            threading.Thread(
+                target=self.db.journal_event,
+                args=('interrupt_requested', {'reason': 'user_interrupt'}, job_id),
+                daemon=True
+            ).start()
+
     def should_stop(self) -> bool:
-        with self._lock:
-            return self.stop_requested
+        # Lock-free atomic read; safe to poll from tight scraper loops.
+        return self._stop_event.is_set()
     
     def _update_progress(self, job_id: int, progress: dict, results_count: int = None):
-        self.db.update_job_progress(job_id, progress, results_count)
-        self.db.journal_event('progress', progress, job_id)
+        # One commit for the progress row and its journal entry, not two
+        with self.db.transaction():
+            self.db.update_job_progress(job_id, progress, results_count)
+            self.db.journal_event('progress', progress, job_id)
     
     def run_job(self, job_id: int, job_func: Callable[[JobContext], Any], async_mode: bool = False) -> Optional[Any]:
         if async_mode:
@@ -73,18 +83,20 @@ class JobRunner:
             return self._run_job_internal(job_id, job_func)
     
     def _run_job_internal(self, job_id: int, job_func: Callable[[JobContext], Any]) -> Any:
-        with self._lock:
-            self.current_job_id = job_id
-            self.stop_requested = False
-        
+        self.current_job_id = job_id
+        self._stop_event.clear()
+
         self.db.update_job_status(job_id, JobStatus.RUNNING)
-        self.db.journal_event('start', {'timestamp': datetime.now().isoformat()}, job_id)
+        # journal.created_at already records when each event happened; don't
+        # duplicate a Python-side timestamp inside the JSON payload.
+        self.db.journal_event('start', {}, job_id)
         
         context = JobContext(
             job_id=job_id,
             db=self.db,
             progress_callback=lambda p, c=None: self._update_progress(job_id, p, c),
-            should_stop=self.should_stop
+            should_stop=self.should_stop,
+            flush_results=lambda batch: self.db.add_job_results_bulk(job_id, batch)
         )
         
         result = None
@@ -92,16 +104,15 @@ class JobRunner:
             result = job_func(context)
             if self.should_stop():
                 self.db.update_job_status(job_id, JobStatus.PAUSED)
-                self.db.journal_event('paused', {'reason': 'interrupt', 'timestamp': datetime.now().isoformat()}, job_id)
+                self.db.journal_event('paused', {'reason': 'interrupt'}, job_id)
             else:
                 self.db.update_job_status(job_id, JobStatus.COMPLETED)
-                self.db.journal_event('complete', {'timestamp': datetime.now().isoformat()}, job_id)
+                self.db.journal_event('complete', {}, job_id)
         except Exception as e:
             self.db.update_job_status(job_id, JobStatus.FAILED, str(e))
-            self.db.journal_event('error', {'error': str(e), 'timestamp': datetime.now().isoformat()}, job_id)
+            self.db.journal_event('error', {'error': str(e)}, job_id)
         finally:
-            with self._lock:
-                self.current_job_id = None
+            self.current_job_id = None
         
         return result
     
@@ -113,7 +124,7 @@ class JobRunner:
             raise ValueError(f"Job {job_id} cannot be resumed (status: {job['status']})")
         
         progress = json.loads(job['progress']) if job['progress'] else {}
-        self.db.journal_event('resume', {'from_progress': progress, 'timestamp': datetime.now().isoformat()}, job_id)
+        self.db.journal_event('resume', {'from_progress': progress}, job_id)
         
         def wrapped_func(ctx: JobContext):
             return job_func(ctx, progress)
@@ -15,9 +15,6 @@ from pathlib import Path
 warnings.filterwarnings('ignore', message='.*OpenSSL.*')
 warnings.filterwarnings('ignore', category=DeprecationWarning)
 
-from grimmoire.repl.interface import GrimmoireREPL
-from grimmoire.db.schema import get_db_path
-
 
 def main():
     parser = argparse.ArgumentParser(
@@ -50,6 +47,10 @@ def main():
     
     args = parser.parse_args()
     
+    # Import after argument parsing: the REPL pulls in rich, prompt_toolkit
+    # and the scraper stack, so --help/--version shouldn't pay for it.
+    from grimmoire.repl.interface import GrimmoireREPL
+    
     try:
         repl = GrimmoireREPL(db_path=args.db)
         repl.run()
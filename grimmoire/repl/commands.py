@@ -1,77 +1,281 @@
 """Command handlers for the Grimmoire REPL."""
-import json
+import os
+import textwrap
+import threading
 import time
 import webbrowser
 import sys
-from typing import Optional, Callable, List, Dict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from functools import cached_property
+from typing import Any, Optional, Callable, List, Dict
 from dataclasses import dataclass
 
-from rich.console import Console
+# rich.live and rich.progress (the live-display machinery) are imported
+# lazily by the commands that stand up a live view; a session that only
+# searches never loads them.
+from rich.console import Console, Group
 from rich.table import Table
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
 
 from ..db.manager import DatabaseManager
 from ..search.engine import SearchEngine, SearchType, SearchResult
-from ..search.pubmed import PubMedClient
-from ..search.web_provider import list_providers, get_provider
+from ..search.web_provider import list_providers, get_provider, provider_display_name
 from ..scraper.sources import SourceRegistry
 from ..scraper.base import ScraperProgress
 from ..jobs.runner import JobRunner, JobContext, JobStatus
 from ..jobs.journal import Journal
 
-# Import crawlers to register them
-from ..scraper.crawlers import naeb
-
 # Strip Rich markup for plain text output
 import re
+
+_RICH_MARKUP_RE = re.compile(r'\[/?[^\]]+\]')
+
 def strip_rich_markup(text: str) -> str:
     """Remove Rich markup tags from text."""
-    return re.sub(r'\[/?[^\]]+\]', '', text)
+    return _RICH_MARKUP_RE.sub('', text)
+
+
+_SCRAPERS_LOADED = False
+
+def _ensure_scrapers():
+    """Import crawler modules so they register with SourceRegistry.
+
+    Done lazily on the first scrape-related command instead of at REPL
+    import: most sessions never scrape, and the crawler imports are pure
+    startup cost otherwise. pkgutil discovery means a new crawler module
+    only has to live in scraper/crawlers to be picked up.
+    """
+    global _SCRAPERS_LOADED
+    if _SCRAPERS_LOADED:
+        return
+    import importlib
+    import pkgutil
+    from ..scraper import crawlers
+    for module_info in pkgutil.iter_modules(crawlers.__path__):
+        importlib.import_module(f'.{module_info.name}', crawlers.__name__)
+    _SCRAPERS_LOADED = True
+
+
+# One animation frame every ~33 ms (~30 fps): the reveal effect reads the
+# same, but write/flush/sleep happen per frame, not per character.
+_FRAME = 0.033
+
+
+def _reveal(text: str, delay: float):
+    """Write text in ~30 fps frames sized to match the per-char delay."""
+    if delay <= 0:
+        sys.stdout.write(text)
+        sys.stdout.flush()
+        return
+    chunk = max(1, int(_FRAME / delay))
+    # Sleep for the time the chunk's characters actually represent, not a
+    # fixed frame: when delay > _FRAME forces chunk=1, a flat _FRAME sleep
+    # would stretch the reveal well past the per-character budget.
+    frame = chunk * delay
+    write = sys.stdout.write
+    flush = sys.stdout.flush
+    for i in range(0, len(text), chunk):
+        write(text[i:i + chunk])
+        flush()
+        time.sleep(frame)
 
 
 def magic_print(text: str, delay: float = 0.018):
-    """Print text letter by letter with magical effect."""
+    """Print text with a magical reveal effect."""
     clean_text = strip_rich_markup(text)
-    for char in clean_text:
-        sys.stdout.write(char)
-        sys.stdout.flush()
-        time.sleep(delay)
-    sys.stdout.write('\n')
-    sys.stdout.flush()
+    # Pipes, redirects, and GRIMMOIRE_FAST sessions get one plain write:
+    # the animation is pure syscall/sleep overhead with nobody watching.
+    if not sys.stdout.isatty() or os.environ.get("GRIMMOIRE_FAST"):
+        sys.stdout.write(clean_text + '\n')
+        return
+    _reveal(clean_text + '\n', delay)
 
 
 def magic_print_block(text: str, line_delay: float = 0.012, char_delay: float = 0.008):
     """Print a block of text with magical effect, line by line."""
     clean_text = strip_rich_markup(text)
+    if not sys.stdout.isatty() or os.environ.get("GRIMMOIRE_FAST"):
+        sys.stdout.write(clean_text + '\n')
+        return
+    # Line-by-line reveal: one write/flush per line instead of per-char
+    # frames — a 50-line panel is 50 syscalls, and the pacing reads better.
+    write = sys.stdout.write
+    flush = sys.stdout.flush
     for line in clean_text.split('\n'):
-        for char in line:
-            sys.stdout.write(char)
-            sys.stdout.flush()
-            time.sleep(char_delay)
-        sys.stdout.write('\n')
-        sys.stdout.flush()
+        write(line + '\n')
+        flush()
         time.sleep(line_delay)
 
 
-@dataclass
+# Column layouts and status colors for the display helpers, defined once at
+# module level so each render only pays for rows, not table scaffolding.
+_WEB_FLAGS = frozenset(('--web', '-w'))
+
+_STATUS_COLORS = {'pending': 'yellow', 'running': 'blue', 'paused': 'magenta',
+                  'completed': 'green', 'failed': 'red'}
+# Fully rendered status cells, so the jobs table looks up a literal string
+# per row instead of formatting the same markup over and over.
+_STATUS_CELLS = {s: f"[{c}]{s}[/{c}]" for s, c in _STATUS_COLORS.items()}
+
+_SOURCE_COLUMNS = (
+    ("ID", {"style": "cyan", "width": 4}),
+    ("Name", {"style": "green", "max_width": 30}),
+    ("Type", {"width": 8}),
+    ("Status", {"width": 10}),
+    ("Last Scraped", {"width": 20}),
+)
+_JOB_COLUMNS = (
+    ("ID", {"style": "cyan", "width": 4}),
+    ("Type", {"width": 10}),
+    ("Status", {"width": 12}),
+    ("Results", {"width": 8}),
+    ("Created", {"width": 20}),
+)
+_STATS_COLUMNS = (
+    ("Entity", {"style": "cyan"}),
+    ("Count", {"style": "green", "justify": "right"}),
+)
+
+
+def _render_no_details(data):
+    return ''
+
+
+def _build_detail_renderers(fields_map):
+    """Compile one straight-line detail renderer per result type.
+
+    Each function is generated from the type's field tuple — just the
+    d.get calls that type needs, unrolled, with the SMILES cap inlined —
+    so rendering a row is a single call with no per-row dispatch over the
+    field table. Generated once at import; run once per row.
+    """
+    renderers = {}
+    for rtype, fields in fields_map.items():
+        lines = ["def _render(d):", "    get = d.get"]
+        for field in fields:
+            lines.append(f"    v = get({field!r})")
+            if field == 'smiles':
+                # SMILES strings can run long; keep the column readable
+                lines.append("    if v: return v[:30]")
+            else:
+                lines.append("    if v: return v")
+        lines.append("    return ''")
+        namespace = {}
+        exec(compile('\n'.join(lines), f'<detail renderer: {rtype}>', 'exec'), namespace)
+        renderers[rtype] = namespace['_render']
+    return renderers
+
+
+def _new_table(title: str, columns: tuple) -> Table:
+    table = Table(title=title, show_header=True)
+    for header, kwargs in columns:
+        table.add_column(header, **kwargs)
+    return table
+
+
+@dataclass(slots=True)
 class CommandResult:
     success: bool
     message: str = ""
-    data: any = None
+    data: Any = None  # was annotated `any` (the builtin function, not a type)
 
 
 class CommandHandler:
     """Handles all REPL commands."""
     
+    # User-facing type words (and their plural/alias forms) to SearchType,
+    # built once at class-body time instead of per cmd_search call.
+    _TYPE_MAP = {
+        'plant': SearchType.PLANT, 'plants': SearchType.PLANT,
+        'ingredient': SearchType.INGREDIENT, 'ingredients': SearchType.INGREDIENT, 'compound': SearchType.INGREDIENT,
+        'ailment': SearchType.AILMENT, 'ailments': SearchType.AILMENT, 'disease': SearchType.AILMENT,
+        'recipe': SearchType.RECIPE, 'recipes': SearchType.RECIPE, 'formula': SearchType.RECIPE,
+        'all': SearchType.ALL,
+    }
+    
+    # Detail-column fallback fields per result type, checked in order; the
+    # first non-empty value wins. Replaces a per-row if/elif chain.
+    _DETAIL_FIELDS = {
+        'plant': ('scientific_name', 'family', 'latin_name'),
+        'ingredient': ('molecular_formula', 'pubchem_cid', 'smiles'),
+        'ailment': ('category', 'status'),
+        'recipe': ('tradition', 'tribe'),
+        'clinical_trial': ('status', 'nct_id'),
+        'ethnobotany': ('tribe', 'category'),
+    }
+    _DETAIL_RENDERERS = _build_detail_renderers(_DETAIL_FIELDS)
+    
     def __init__(self, db: DatabaseManager, console: Console):
         self.db = db
         self.console = console
         self.search_engine = SearchEngine(db)
-        self.pubmed = PubMedClient()
         self.job_runner = JobRunner(db)
         self.journal = Journal(db)
         self._last_results: List[SearchResult] = []  # Store last search results
+        self._dict_future = None  # In-flight background dictionary refresh
+    
+    def _parse_int_arg(self, args: List[str], idx: int, usage: str):
+        """Parse args[idx] as an int; returns (value, None) or (None, error).
+
+        One helper instead of a try/int/except block stamped into every
+        sources/jobs branch.
+        """
+        try:
+            return int(args[idx]), None
+        except (ValueError, IndexError):
+            return None, CommandResult(False, usage)
+    
+    @cached_property
+    def _refresh_pool(self):
+        # Single worker: refreshes are idempotent full rebuilds, so queueing
+        # them one behind another is all the ordering we need.
+        return ThreadPoolExecutor(max_workers=1)
+    
+    def _refresh_dictionary_async(self):
+        """Rebuild the spellcheck dictionary off the foreground path.
+
+        The scrape command returns as soon as the data is written; the
+        rebuild runs on a worker thread and cmd_search waits on it (rarely,
+        and briefly) only if the user searches before it finishes.
+        """
+        self._dict_future = self._refresh_pool.submit(
+            self.search_engine.refresh_dictionary)
+    
+    def _await_dictionary(self):
+        future = self._dict_future
+        if future is None:
+            return
+        if not future.done():
+            self.console.print("[dim]Refreshing index...[/dim]")
+        try:
+            future.result()
+        except Exception:
+            pass
+        self._dict_future = None
+    
+    @cached_property
+    def _progress(self):
+        # One Progress instance for the handler's lifetime: entering a fresh
+        # one per scrape sets up the live renderer (thread + hooks) each
+        # time, which is several ms of pure overhead in a REPL loop.
+        # 4 Hz refresh (vs the 10 Hz default) and a transient bar: fewer
+        # render-thread wakeups while the scraper hammers the callback,
+        # and the bar clears instead of scrolling the summary away.
+        from rich.progress import (Progress, SpinnerColumn, TextColumn,
+                                   BarColumn, TaskProgressColumn)
+        return Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}"),
+                        BarColumn(), TaskProgressColumn(), console=self.console,
+                        refresh_per_second=4, transient=True)
+    
+    @cached_property
+    def pubmed(self):
+        # Constructed on first use so the pubmed module is only paid for by
+        # users who run the command; rides the session shared with the web
+        # providers so NCBI connections stay pooled alongside theirs.
+        from ..search.pubmed import PubMedClient
+        from ..search.web_provider import get_shared_session
+        return PubMedClient(session=get_shared_session())
     
     def cmd_search(self, args: List[str]) -> CommandResult:
         """Search for entries. Usage: search <type> <query> [--web]
@@ -82,23 +286,34 @@ class CommandHandler:
         if len(args) < 2:
             return CommandResult(False, "Usage: search <type> <query> [--web]\nTypes: plant, ingredient, ailment, recipe, all")
         
-        type_map = {
-            'plant': SearchType.PLANT, 'plants': SearchType.PLANT,
-            'ingredient': SearchType.INGREDIENT, 'ingredients': SearchType.INGREDIENT, 'compound': SearchType.INGREDIENT,
-            'ailment': SearchType.AILMENT, 'ailments': SearchType.AILMENT, 'disease': SearchType.AILMENT,
-            'recipe': SearchType.RECIPE, 'recipes': SearchType.RECIPE, 'formula': SearchType.RECIPE,
-            'all': SearchType.ALL,
-        }
-        
-        # Parse --web flag
-        force_web = '--web' in args or '-w' in args
-        args = [a for a in args if a not in ('--web', '-w')]
+        # Parse --web flag in one scan
+        force_web = False
+        query_args = []
+        for a in args:
+            if a in _WEB_FLAGS:
+                force_web = True
+            else:
+                query_args.append(a)
+        args = query_args
         
-        search_type = type_map.get(args[0].lower(), SearchType.ALL)
+        search_type = self._TYPE_MAP.get(args[0].lower(), SearchType.ALL)
         query = ' '.join(args[1:])
-        
-        with self.console.status(f"[bold green]Searching for '{query}'...") if force_web else self.console.status(""):
-            results, suggestion = self.search_engine.search(query, search_type, include_web=force_web if force_web else None)
+        return self._do_search(search_type, query, force_web)
+    
+    def _do_search(self, search_type: SearchType, query: str,
+                   force_web: bool) -> CommandResult:
+        """Run a parsed search; shared by cmd_search and cmd_find."""
+        # If a post-scrape dictionary rebuild is still running, finish it so
+        # spell correction sees the new names
+        self._await_dictionary()
+        
+        if force_web:
+            # Only web-bound searches get a spinner; local FTS answers fast
+            # enough that standing up a live status display just adds cost.
+            with self.console.status(f"[bold green]Searching for '{query}'..."):
+                results, suggestion = self.search_engine.search(query, search_type, include_web=True)
+        else:
+            results, suggestion = self.search_engine.search(query, search_type, include_web=None)
         
         if suggestion:
             magic_print(f"🔮 Did you mean: {suggestion}?")
@@ -107,12 +322,13 @@ class CommandHandler:
             magic_print("No results found in the grimmoire...")
             return CommandResult(True, "No results", [])
         
-        # Check if any results came from web
-        has_web_results = any(r.source != 'local' for r in results)
-        self._display_results(results, show_source=has_web_results)
-        
-        local_count = sum(1 for r in results if r.source == 'local')
+        # Tally sources in one pass instead of separate any()/sum() sweeps
+        local_count = 0
+        for r in results:
+            if r.source == 'local':
+                local_count += 1
         web_count = len(results) - local_count
+        self._display_results(results, show_source=web_count > 0)
         if web_count > 0:
             return CommandResult(True, f"Found {local_count} local + {web_count} online results", results)
         return CommandResult(True, f"Found {len(results)} results", results)
@@ -124,24 +340,46 @@ class CommandHandler:
         
         query = ' '.join(args)
         
-        with self.console.status(f"[bold green]Searching PubMed for '{query}'..."):
-            try:
-                results = self.pubmed.search_herbs(query, max_results=10)
-            except Exception as e:
+        # Repeat queries are served from the on-disk cache (24h TTL) so they
+        # render instantly and don't burn NCBI rate limit.
+        cache_key = query.lower().strip()
+        results = self.db.get_cached_pubmed(cache_key, 10)
+        if results is not None:
+            if not results:
+                magic_print("No PubMed scrolls found...")
+                return CommandResult(True, "No results", [])
+            self._display_pubmed_results(results)
+            return CommandResult(True, f"Found {len(results)} articles", results)
+        
+        # Stream panels as each efetch batch lands instead of waiting for the
+        # whole result set: time-to-first-article is one esearch + one efetch.
+        magic_print(f"🔍 Searching PubMed for '{query}'...")
+        results = []
+        try:
+            for article in self.pubmed.iter_search_herbs(query, max_results=10):
+                results.append(article)
+                self.console.print(self._pubmed_panel(len(results), article))
+        except Exception as e:
+            if not results:
                 return CommandResult(False, f"PubMed search failed: {e}")
+            # Don't cache a truncated set: the next attempt should retry the
+            # full fetch rather than serve the partial list for 24h.
+            magic_print(f"⚠️  PubMed search interrupted: {e}")
+            return CommandResult(True, f"Found {len(results)} articles (partial)", results)
+        self.db.cache_pubmed(cache_key, 10, results)
         
         if not results:
             magic_print("No PubMed scrolls found...")
             return CommandResult(True, "No results", [])
-        
-        self._display_pubmed_results(results)
         return CommandResult(True, f"Found {len(results)} articles", results)
     
     def cmd_find(self, args: List[str]) -> CommandResult:
         """Quick search across all types. Usage: find <query>"""
         if not args:
             return CommandResult(False, "Usage: find <query>")
-        return self.cmd_search(['all'] + args)
+        # Straight to the shared search body; no re-dispatch through
+        # cmd_search's argument parsing
+        return self._do_search(SearchType.ALL, ' '.join(args), False)
     
     def cmd_websearch(self, args: List[str]) -> CommandResult:
         """Search online databases. Usage: websearch <query> [--provider <name>]
@@ -164,8 +402,9 @@ class CommandHandler:
             providers = list_providers()
             magic_print("✨ Available web search providers:")
             for name in providers:
-                provider = get_provider(name)
-                magic_print(f"  • {name} - {provider.name}")
+                # Display names come off the registry classes; no need to
+                # construct a provider just to read its name.
+                magic_print(f"  • {name} - {provider_display_name(name)}")
             return CommandResult(True, "Listed providers", providers)
         
         # Parse arguments
@@ -186,8 +425,21 @@ class CommandHandler:
         query = ' '.join(query_parts)
         
         magic_print(f"🔮 Scrying the universe for '{query}'...")
+        # Render providers as they finish: the growing table refreshes in
+        # place, so time-to-first-row tracks the fastest provider rather
+        # than the slowest. Cache hits skip the callback and render below.
+        collected = []
         try:
-            results = self.search_engine.search_web_only(query, SearchType.ALL, 20, provider_filter)
+            from rich.live import Live
+            with Live(console=self.console, refresh_per_second=4) as live:
+                def on_results(batch):
+                    collected.extend(batch)
+                    live.update(self._results_table(collected, show_source=True))
+                results = self.search_engine.search_web_only(
+                    query, SearchType.ALL, 20, provider_filter, on_results=on_results)
+                if results:
+                    # Final frame: the sorted, truncated result set
+                    live.update(self._results_table(results, show_source=True))
         except Exception as e:
             return CommandResult(False, f"Web search failed: {e}")
         
@@ -195,7 +447,11 @@ class CommandHandler:
             magic_print("The universe reveals nothing...")
             return CommandResult(True, "No results", [])
         
-        self._display_results(results, show_source=True)
+        if not collected:
+            self._display_results(results, show_source=True)
+        else:
+            # _display_results normally records these for read/open
+            self._last_results = results
         return CommandResult(True, f"Found {len(results)} results from online sources", results)
     
     def cmd_read(self, args: List[str]) -> CommandResult:
@@ -241,29 +497,21 @@ class CommandHandler:
             
             if isinstance(value, list):
                 if value:
-                    lines.append(f"{display_key}:")
-                    for item in value:
-                        lines.append(f"  • {item}")
+                    # One joined block per collection instead of a Python-
+                    # level append per element; join concatenates in C.
+                    lines.append(f"{display_key}:\n" +
+                                 "\n".join(f"  • {item}" for item in value))
             elif isinstance(value, dict):
-                lines.append(f"{display_key}:")
-                for k, v in value.items():
-                    lines.append(f"  {k}: {v}")
+                lines.append(f"{display_key}:\n" +
+                             "\n".join(f"  {k}: {v}" for k, v in value.items()))
             elif value:
                 # Wrap long text
                 str_value = str(value)
                 if len(str_value) > 70:
                     lines.append(f"{display_key}:")
-                    # Word wrap
-                    words = str_value.split()
-                    current_line = "  "
-                    for word in words:
-                        if len(current_line) + len(word) + 1 > 70:
-                            lines.append(current_line)
-                            current_line = "  " + word
-                        else:
-                            current_line += " " + word if current_line != "  " else word
-                    if current_line.strip():
-                        lines.append(current_line)
+                    lines.extend(textwrap.wrap(str_value, width=68,
+                                               initial_indent="  ",
+                                               subsequent_indent="  "))
                 else:
                     lines.append(f"{display_key}: {str_value}")
         
@@ -307,7 +555,10 @@ class CommandHandler:
         if not result.url:
             return CommandResult(False, f"No URL available for result #{idx + 1}. Use 'read {idx + 1}' to view details.")
         
-        webbrowser.open(result.url)
+        # Fire and forget: xdg-open/LaunchServices can block for hundreds
+        # of ms probing handlers, and the REPL has nothing to wait for.
+        threading.Thread(target=webbrowser.open, args=(result.url,),
+                         daemon=True).start()
         magic_print(f"✓ Portal opened: {result.data.get('name', 'Unknown')}")
         
         return CommandResult(True, f"Opened result #{idx + 1} in browser", result)
@@ -329,26 +580,23 @@ class CommandHandler:
             source_id = self.db.add_source(args[1], args[2])
             return CommandResult(True, f"Added source '{args[1]}' (ID: {source_id})")
         elif action == 'enable':
-            if len(args) < 2:
-                return CommandResult(False, "Usage: sources enable <id>")
-            try:
-                self.db.enable_source(int(args[1]))
-                return CommandResult(True, f"Enabled source {args[1]}")
-            except ValueError:
-                return CommandResult(False, "Invalid source ID")
+            source_id, err = self._parse_int_arg(args, 1, "Usage: sources enable <id>")
+            if err:
+                return err
+            self.db.enable_source(source_id)
+            return CommandResult(True, f"Enabled source {source_id}")
         elif action in ('disable', 'exclude'):
-            if len(args) < 2:
-                return CommandResult(False, "Usage: sources disable <id>")
-            try:
-                self.db.disable_source(int(args[1]))
-                return CommandResult(True, f"Disabled source {args[1]}")
-            except ValueError:
-                return CommandResult(False, "Invalid source ID")
+            source_id, err = self._parse_int_arg(args, 1, "Usage: sources disable <id>")
+            if err:
+                return err
+            self.db.disable_source(source_id)
+            return CommandResult(True, f"Disabled source {source_id}")
         else:
             return CommandResult(False, f"Unknown action: {action}")
     
     def cmd_scrape(self, args: List[str], timeout: float = 30.0) -> CommandResult:
         """Scrape data from a source. Usage: scrape <source_name> [--background]"""
+        _ensure_scrapers()
         if not args:
             available = SourceRegistry.list_sources()
             magic_print("📜 Available gathering rituals:")
@@ -359,80 +607,177 @@ class CommandHandler:
         source_name = args[0]
         background = '--background' in args or '-b' in args
         
+        if source_name.lower() == 'all':
+            return self._scrape_all(background)
+        
         if not SourceRegistry.has_scraper(source_name):
             return CommandResult(False, f"No scraper available for '{source_name}'")
         
-        job_id = self.db.create_job('scrape', {'source': source_name})
-        
-        def scrape_job(ctx: JobContext):
-            scraper = SourceRegistry.get_scraper(source_name, ctx.db)
-            def progress_callback(item, progress: ScraperProgress):
-                ctx.progress_callback(progress.to_dict(), progress.processed_items)
-                if ctx.should_stop():
-                    scraper.request_stop()
-            return scraper.run(callback=progress_callback)
+        job_id = self.db.create_job('scrape', {'source': source_name}, source_name=source_name)
         
         if background:
+            scrape_job = self._make_scrape_job(source_name)
             self.job_runner.run_job(job_id, scrape_job, async_mode=True)
             return CommandResult(True, f"Started background scrape job {job_id}")
         else:
-            with Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}"),
-                         BarColumn(), TaskProgressColumn(), console=self.console) as progress:
-                task = progress.add_task(f"Scraping {source_name}...", total=None)
-                start_time = time.time()
-                
-                def display_progress(ctx: JobContext):
-                    scraper = SourceRegistry.get_scraper(source_name, ctx.db)
-                    def callback(item, prog: ScraperProgress):
-                        progress.update(task, completed=prog.processed_items, total=prog.total_items or None,
-                                       description=f"Scraping {source_name}: {prog.processed_items} items")
-                        ctx.progress_callback(prog.to_dict(), prog.processed_items)
-                        if time.time() - start_time > timeout:
-                            scraper.request_stop()
-                        if ctx.should_stop():
-                            scraper.request_stop()
-                    return scraper.run(callback=callback)
-                
+            progress = self._progress
+            progress.start()
+            task = progress.add_task(f"Scraping {source_name}...", total=None)
+            try:
+                display_progress = self._make_scrape_job(
+                    source_name, ui=(progress, task),
+                    timeout_deadline=time.monotonic() + timeout)
                 self.job_runner.run_job(job_id, display_progress)
+            finally:
+                progress.remove_task(task)
+                progress.stop()
             
             job = self.db.get_job(job_id)
-            self.search_engine.refresh_dictionary()
+            self._refresh_dictionary_async()
             return CommandResult(True, f"Scraped {job['results_count']} items from {source_name}")
     
+    def _make_scrape_job(self, source_name: str, ui=None, timeout_deadline: float = None):
+        """Build the job callable for a single-source scrape.
+
+        The scraper is constructed exactly once, here, and captured by the
+        closures: the per-item callback touches only locals, with no registry
+        lookup on the hot path. With `ui` (a (Progress, task) pair) the
+        callback also repaints the bar, throttled to 100 ms / 50 items; the
+        journal checkpoint is throttled to 1 s / 100 items either way, and
+        completion forces a final flush of both. The callable also accepts
+        JobRunner.resume_job's saved-progress dict, so fresh and resumed
+        scrapes share one throttled path.
+        """
+        scraper = SourceRegistry.get_scraper(source_name, self.db)
+        if ui:
+            progress, task = ui
+        last_ui = [0.0]
+        last_ui_n = [0]
+        last_ckpt = [0.0]
+        last_ckpt_n = [0]
+        tick = [0]
+
+        def scrape_job(ctx: JobContext, saved_progress: dict = None):
+            resume_from = ScraperProgress.from_dict(saved_progress) if saved_progress else None
+            request_stop = scraper.request_stop
+            def callback(item, prog: ScraperProgress):
+                n = prog.processed_items
+                # The stop flag is a cheap Event check; run it every item so
+                # Ctrl+C stays responsive. The clock read is not free at
+                # thousands of items/sec, so time-based gates (timeout, the
+                # 0.1 s/1 s throttles) only fire every 64th item; the
+                # count-based gates and the completion flush run every call.
+                if ctx.should_stop():
+                    request_stop()
+                done = bool(prog.total_items) and n == prog.total_items
+                tick[0] += 1
+                now = time.monotonic() if (done or tick[0] & 0x3F == 0) else None
+                if now is not None and timeout_deadline and now > timeout_deadline:
+                    request_stop()
+                if ui and (done or n - last_ui_n[0] >= 50 or
+                           (now is not None and now - last_ui[0] > 0.1)):
+                    if now is None:
+                        now = time.monotonic()
+                    progress.update(task, completed=n, total=prog.total_items or None,
+                                   description=f"Scraping {source_name}: {n} items")
+                    last_ui[0] = now
+                    last_ui_n[0] = n
+                if (done or n - last_ckpt_n[0] >= 100 or
+                        (now is not None and now - last_ckpt[0] > 1.0)):
+                    if now is None:
+                        now = time.monotonic()
+                    ctx.progress_callback(prog.to_json(), n)
+                    last_ckpt[0] = now
+                    last_ckpt_n[0] = n
+            result = scraper.run(resume_from=resume_from, callback=callback)
+            # Final checkpoint so jobs.progress reflects the true count
+            ctx.progress_callback(scraper.progress.to_json(), scraper.progress.processed_items)
+            return result
+
+        return scrape_job
+
+    def _scrape_all(self, background: bool) -> CommandResult:
+        """Run every registered scraper concurrently under one job.
+
+        The scrapers are I/O-bound HTTP loops, so a small thread pool
+        overlaps their network waits; DatabaseManager serializes writes
+        internally, making concurrent run() calls safe.
+        """
+        names = SourceRegistry.list_sources()
+        if not names:
+            return CommandResult(False, "No scrapers registered")
+        
+        job_id = self.db.create_job('scrape', {'source': 'all', 'sources': names}, source_name='all')
+        
+        def scrape_all_job(ctx: JobContext):
+            counts = {}
+            def run_one(name):
+                scraper = SourceRegistry.get_scraper(name, ctx.db)
+                def callback(item, prog: ScraperProgress):
+                    if ctx.should_stop():
+                        scraper.request_stop()
+                return name, scraper.run(callback=callback).processed_items
+            with ThreadPoolExecutor(max_workers=min(4, len(names))) as pool:
+                for name, count in pool.map(run_one, names):
+                    counts[name] = count
+                    ctx.progress_callback({'completed': counts}, sum(counts.values()))
+            return counts
+        
+        if background:
+            self.job_runner.run_job(job_id, scrape_all_job, async_mode=True)
+            return CommandResult(True, f"Started background scrape job {job_id} for {len(names)} sources")
+        
+        with self.console.status(f"[bold green]Scraping {len(names)} sources..."):
+            self.job_runner.run_job(job_id, scrape_all_job)
+        job = self.db.get_job(job_id)
+        self._refresh_dictionary_async()
+        return CommandResult(True, f"Scraped {job['results_count'] or 0} items from {len(names)} sources")
+    
     def cmd_jobs(self, args: List[str]) -> CommandResult:
-        """Manage background jobs. Usage: jobs [list|status|resume|stop] [job_id]"""
+        """Manage background jobs. Usage: jobs [list|status|watch|resume|stop] [job_id]"""
+        # Resuming a job needs the scrapers registered
+        _ensure_scrapers()
         if not args:
             args = ['list']
         
         action = args[0].lower()
         
         if action == 'list':
-            jobs = self.db.get_jobs()
+            jobs = self.db.list_jobs(limit=20)
             self._display_jobs(jobs)
             return CommandResult(True, f"{len(jobs)} jobs")
         elif action == 'status':
-            if len(args) < 2:
-                return CommandResult(False, "Usage: jobs status <job_id>")
-            try:
-                job_id = int(args[1])
-                job = self.db.get_job(job_id)
-                if not job:
-                    return CommandResult(False, f"Job {job_id} not found")
-                summary = self.journal.summarize_job(job_id)
-                self._display_job_status(job, summary)
-                return CommandResult(True, f"Job {job_id} status", summary)
-            except ValueError:
-                return CommandResult(False, "Invalid job ID")
+            job_id, err = self._parse_int_arg(args, 1, "Usage: jobs status <job_id>")
+            if err:
+                return err
+            job = self.db.get_job(job_id)
+            if not job:
+                return CommandResult(False, f"Job {job_id} not found")
+            summary = self.journal.summarize_job(job_id)
+            self._display_job_status(job, summary)
+            return CommandResult(True, f"Job {job_id} status", summary)
         elif action == 'resume':
-            if len(args) < 2:
-                return CommandResult(False, "Usage: jobs resume <job_id>")
-            try:
-                return self._resume_job(int(args[1]))
-            except ValueError:
-                return CommandResult(False, "Invalid job ID")
+            job_id, err = self._parse_int_arg(args, 1, "Usage: jobs resume <job_id>")
+            if err:
+                return err
+            return self._resume_job(job_id)
         elif action == 'stop':
             self.job_runner.request_stop()
             return CommandResult(True, "Stop requested for current job")
+        elif action == 'watch':
+            # Live-refresh the jobs table while anything is running, instead
+            # of the user re-running 'jobs list' (a full reprint each time).
+            from rich.live import Live
+            with Live(self._jobs_table(self.db.list_jobs(limit=20)), console=self.console,
+                      refresh_per_second=4) as live:
+                deadline = time.time() + 60
+                while time.time() < deadline:
+                    jobs = self.db.list_jobs(limit=20)
+                    live.update(self._jobs_table(jobs))
+                    if not any(j['status'] == 'running' for j in jobs):
+                        break
+                    time.sleep(0.5)
+            return CommandResult(True, "Watch ended")
         else:
             return CommandResult(False, f"Unknown action: {action}")
     
@@ -443,22 +788,17 @@ class CommandHandler:
         if job['status'] != JobStatus.PAUSED:
             return CommandResult(False, f"Job {job_id} is not paused (status: {job['status']})")
         
-        query = json.loads(job['query']) if job['query'] else {}
-        source_name = query.get('source')
+        # source_name is denormalized onto the jobs row (backfilled for old
+        # databases), so no JSON parse is needed here.
+        source_name = job['source_name']
         if not source_name:
             return CommandResult(False, "Cannot determine source for job")
         
-        def resume_scrape(ctx: JobContext, saved_progress: dict):
-            scraper = SourceRegistry.get_scraper(source_name, ctx.db)
-            resume_from = ScraperProgress.from_dict(saved_progress)
-            def callback(item, prog: ScraperProgress):
-                ctx.progress_callback(prog.to_dict(), prog.processed_items)
-                if ctx.should_stop():
-                    scraper.request_stop()
-            return scraper.run(resume_from=resume_from, callback=callback)
-        
         magic_print(f"🔄 Resuming ritual {job_id}...")
-        self.job_runner.resume_job(job_id, resume_scrape, async_mode=True)
+        # Same factory as fresh scrapes, so the resume path gets the
+        # serialize-once to_json() checkpoints and 1 s/100-item throttle too
+        self.job_runner.resume_job(job_id, self._make_scrape_job(source_name),
+                                   async_mode=True)
         return CommandResult(True, f"Resumed job {job_id}")
     
     def cmd_db(self, args: List[str]) -> CommandResult:
@@ -478,108 +818,125 @@ class CommandHandler:
         else:
             return CommandResult(False, f"Unknown action: {action}")
     
-    def _display_results(self, results: List[SearchResult], show_source: bool = False):
-        # Store results for later reference (e.g., opening URLs)
-        self._last_results = results
-        
-        # Magic reveal of title
-        magic_print("✨ Revealing ancient wisdom...", delay=0.02)
-        
+    def _results_table(self, results: List[SearchResult], show_source: bool = False) -> Table:
+        return self._build_results_view(results, show_source)[0]
+
+    def _build_results_view(self, results: List[SearchResult], show_source: bool = False):
+        """Build the results table, also reporting whether any row had a URL
+        (picked up in the same loop so the caller needn't rescan)."""
         table = Table(title="Search Results", show_header=True)
         table.add_column("#", style="bold yellow", width=3)
         table.add_column("Type", style="cyan", width=12)
-        table.add_column("Name", style="green")
+        # Pre-size the one variable column from the data so Rich renders
+        # with fixed widths instead of re-measuring every cell.
+        name_width = max((len(r.data.get('name') or '') for r in islice(results, 20)),
+                         default=8)
+        table.add_column("Name", style="green", width=min(name_width + 2, 50))
         if show_source:
             table.add_column("Source", style="magenta", width=15)
         table.add_column("Details", style="dim")
         
-        for idx, result in enumerate(results[:20], 1):
+        # Build all row tuples first, then feed the table: the row loop is
+        # pure tuple construction with locals, no table internals per cell.
+        # Detail cells come from the pre-compiled per-type renderers.
+        renderers = self._DETAIL_RENDERERS
+        # Row shape is fixed for the whole table; pick it once instead of
+        # re-branching on show_source per row.
+        if show_source:
+            build_row = lambda idx, r, name, details: (str(idx), r.type, name, r.source, details)
+        else:
+            build_row = lambda idx, r, name, details: (str(idx), r.type, name, details)
+        rows = []
+        has_url = False
+        for idx, result in enumerate(islice(results, 20), 1):
             name = result.data.get('name', 'Unknown')
-            details = ""
-            if result.type == 'plant':
-                details = result.data.get('scientific_name', '') or result.data.get('family', '') or result.data.get('latin_name', '')
-            elif result.type == 'ingredient':
-                details = result.data.get('molecular_formula', '') or result.data.get('pubchem_cid', '') or result.data.get('smiles', '')[:30] if result.data.get('smiles') else ''
-            elif result.type == 'ailment':
-                details = result.data.get('category', '') or result.data.get('status', '')
-            elif result.type == 'recipe':
-                details = result.data.get('tradition', '') or result.data.get('tribe', '')
-            elif result.type == 'clinical_trial':
-                details = result.data.get('status', '') or result.data.get('nct_id', '')
-            elif result.type == 'ethnobotany':
-                details = result.data.get('tribe', '') or result.data.get('category', '')
+            details = renderers.get(result.type, _render_no_details)(result.data)
             
             # Add URL as clickable link if present
             if result.url:
+                has_url = True
                 name = f"[link={result.url}]{name}[/link]"
             
-            if show_source:
-                table.add_row(str(idx), result.type, name, result.source, details or "")
-            else:
-                table.add_row(str(idx), result.type, name, details or "")
+            rows.append(build_row(idx, result, name, details))
         
+        add_row = table.add_row
+        for row in rows:
+            add_row(*row)
+        return table, has_url
+
+    def _display_results(self, results: List[SearchResult], show_source: bool = False):
+        # Store results for later reference (e.g., opening URLs)
+        self._last_results = results
+        
+        # Magic reveal of title
+        magic_print("✨ Revealing ancient wisdom...", delay=0.02)
+        
+        table, has_url = self._build_results_view(results, show_source)
         self.console.print(table)
-        if len(results) > 20:
-            magic_print(f"... and {len(results) - 20} more results")
+        extra = len(results) - 20
+        if extra > 0:
+            magic_print(f"... and {extra} more results")
         
         # Show hint about opening results
-        if any(r.url for r in results[:20]):
+        if has_url:
             magic_print("💡 Use 'read <#>' to view details, 'open <#>' to open in browser")
     
+    def _pubmed_panel(self, i: int, article: Dict) -> Panel:
+        # Bind authors once; the old code called .get('authors', []) three
+        # times per article, allocating a fresh empty list each miss.
+        authors_all = article.get('authors') or ()
+        authors = ', '.join(authors_all[:3])
+        if len(authors_all) > 3:
+            authors += ' et al.'
+        title = article.get('title', 'No title')
+        source = article.get('source', '')
+        pubdate = article.get('pubdate', '')
+        pmid = article.get('pmid', '')
+        return Panel(
+            f"[bold]{title}[/bold]\n\n[dim]{authors}[/dim]\n{source} ({pubdate})\n[link=https://pubmed.ncbi.nlm.nih.gov/{pmid}]PMID: {pmid}[/link]",
+            title=f"[{i}]", border_style="blue"
+        )
+
     def _display_pubmed_results(self, results: List[Dict]):
-        for i, article in enumerate(results, 1):
-            title = article.get('title', 'No title')
-            authors = ', '.join(article.get('authors', [])[:3])
-            if len(article.get('authors', [])) > 3:
-                authors += ' et al.'
-            source = article.get('source', '')
-            pubdate = article.get('pubdate', '')
-            pmid = article.get('pmid', '')
-            
-            panel = Panel(
-                f"[bold]{title}[/bold]\n\n[dim]{authors}[/dim]\n{source} ({pubdate})\n[link=https://pubmed.ncbi.nlm.nih.gov/{pmid}]PMID: {pmid}[/link]",
-                title=f"[{i}]", border_style="blue"
-            )
-            self.console.print(panel)
+        # One print of a Group renders all panels in a single layout pass
+        panel = self._pubmed_panel
+        self.console.print(Group(*(panel(i, article)
+                                   for i, article in enumerate(results, 1))))
     
     def _display_sources(self, sources: List[Dict]):
-        table = Table(title="Data Sources", show_header=True)
-        table.add_column("ID", style="cyan", width=4)
-        table.add_column("Name", style="green")
-        table.add_column("Type", width=8)
-        table.add_column("Status", width=10)
-        table.add_column("Last Scraped", width=20)
-        
-        for source in sources:
-            status = "[green]Enabled[/green]" if source['enabled'] else "[red]Disabled[/red]"
-            table.add_row(str(source['id']), source['name'], source['source_type'], status, source.get('last_scraped') or "Never")
+        table = _new_table("Data Sources", _SOURCE_COLUMNS)
+        rows = [(str(source['id']), source['name'], source['source_type'],
+                 "[green]Enabled[/green]" if source['enabled'] else "[red]Disabled[/red]",
+                 source.get('last_scraped') or "Never")
+                for source in sources]
+        add_row = table.add_row
+        for row in rows:
+            add_row(*row)
         self.console.print(table)
     
+    def _jobs_table(self, jobs: List[Dict]) -> Table:
+        table = _new_table("Jobs", _JOB_COLUMNS)
+        status_cell = _STATUS_CELLS.get
+        rows = [(str(job['id']), job['job_type'],
+                 status_cell(job['status'], job['status']),
+                 str(job['results_count'] or 0),
+                 job['created_at'][:19] if job['created_at'] else "")
+                for job in jobs]
+        add_row = table.add_row
+        for row in rows:
+            add_row(*row)
+        return table
+
     def _display_jobs(self, jobs: List[Dict]):
-        table = Table(title="Jobs", show_header=True)
-        table.add_column("ID", style="cyan", width=4)
-        table.add_column("Type", width=10)
-        table.add_column("Status", width=12)
-        table.add_column("Results", width=8)
-        table.add_column("Created", width=20)
-        
-        status_colors = {'pending': 'yellow', 'running': 'blue', 'paused': 'magenta', 'completed': 'green', 'failed': 'red'}
-        
-        for job in jobs[:20]:
-            status = job['status']
-            color = status_colors.get(status, 'white')
-            table.add_row(str(job['id']), job['job_type'], f"[{color}]{status}[/{color}]",
-                         str(job['results_count'] or 0), job['created_at'][:19] if job['created_at'] else "")
-        self.console.print(table)
+        self.console.print(self._jobs_table(jobs))
     
     def _display_job_status(self, job: Dict, summary: Dict):
-        status_colors = {'pending': 'yellow', 'running': 'blue', 'paused': 'magenta', 'completed': 'green', 'failed': 'red'}
         status = job['status']
-        color = status_colors.get(status, 'white')
+        color = _STATUS_COLORS.get(status, 'white')
         
         content = f"""[bold]Job ID:[/bold] {job['id']}
 [bold]Type:[/bold] {job['job_type']}
-[bold]Status:[/bold] [{color}]{status}[/{color}]
+[bold]Status:[/bold] {_STATUS_CELLS.get(status, status)}
 [bold]Results:[/bold] {job['results_count'] or 0}
 [bold]Duration:[/bold] {summary.get('duration', 'N/A')}
 [bold]Interrupts:[/bold] {summary.get('interrupts', 0)}
@@ -593,9 +950,7 @@ class CommandHandler:
         self.console.print(Panel(content, title="Job Status", border_style=color))
     
     def _display_stats(self, stats: Dict):
-        table = Table(title="Database Statistics", show_header=True)
-        table.add_column("Entity", style="cyan")
-        table.add_column("Count", style="green", justify="right")
+        table = _new_table("Database Statistics", _STATS_COLUMNS)
         for entity, count in stats.items():
             table.add_row(entity.title(), str(count))
         self.console.print(table)
@@ -3,19 +3,14 @@ import sys
 import shlex
 import random
 import time
+from functools import lru_cache
 from typing import Optional, List
 from pathlib import Path
 
 from rich.console import Console
-from rich.panel import Panel
-from rich.markdown import Markdown
 from rich.text import Text
-from rich.style import Style
 from rich.theme import Theme
 from prompt_toolkit.formatted_text import HTML
-from prompt_toolkit import PromptSession
-from prompt_toolkit.history import FileHistory
-from prompt_toolkit.auto_suggest import AutoSuggestFromHistory
 from prompt_toolkit.completion import Completer, Completion
 
 from ..db.manager import DatabaseManager
@@ -23,6 +18,8 @@ from ..db.schema import get_db_path
 from .commands import CommandHandler, CommandResult, magic_print, magic_print_block
 
 
+_MOON_PHASES = ('🌑', '🌒', '🌓', '🌔', '🌕', '🌖', '🌗', '🌘')
+
 # Witchy color theme
 WITCHY_THEME = Theme({
     "info": "dim cyan",
@@ -60,6 +57,10 @@ BANNER = """
 [bold green]╚══════════════════════════════════════════════════════════════════╝[/bold green]
 """
 
+# Lazily parsed Text built from BANNER on first run(); markup parsing is
+# regex-heavy and need not run again for the same string
+_BANNER_RENDERABLE = None
+
 WITCHY_TIPS = [
     "🌙 Tip: Brew your database with [green]scrape \"NAEB Datasette\"[/green]",
     "🔮 Tip: Divine PubMed secrets with [green]pubmed <query>[/green]",
@@ -144,84 +145,186 @@ HELP_TEXT = """
 - The grimmoire remembers your search history
 """
 
+# Markdown instance built from HELP_TEXT on first `help`
+_HELP_RENDERABLE = None
+
+
+class _PrefixTrie:
+    """Minimal character trie for prefix completion.
+
+    Lookup walks the prefix once (O(len(prefix))) and then yields the
+    subtree in sorted order, so per-keystroke cost stays flat as
+    vocabularies grow — no linear startswith scan per candidate.
+    """
+    __slots__ = ('_root',)
+    _WORD = ''  # terminal marker; stores the original (uncased) word
+
+    def __init__(self, words=()):
+        self._root = {}
+        for word in words:
+            self.insert(word)
+
+    def insert(self, word: str):
+        node = self._root
+        for ch in word.lower():
+            node = node.setdefault(ch, {})
+        node[self._WORD] = word
+
+    def iter_prefix(self, prefix: str):
+        node = self._root
+        for ch in prefix.lower():
+            node = node.get(ch)
+            if node is None:
+                return
+        yield from self._walk(node)
+
+    def _walk(self, node):
+        word = node.get(self._WORD)
+        if word is not None:
+            yield word
+        for ch in sorted(node):
+            if ch:
+                yield from self._walk(node[ch])
+
 
 class GrimmoireCompleter(Completer):
     """Custom completer with witchy flair."""
     
     def __init__(self, handler: CommandHandler):
         self.handler = handler
-        self.commands = ['search', 'find', 'pubmed', 'searchtheuniverse', 'read', 'open', 'sources', 'scrape', 'jobs', 'db', 'help', 'quit', 'exit']
-        self.search_types = ['plant', 'ingredient', 'ailment', 'recipe', 'all']
-        self.sources_actions = ['list', 'add', 'enable', 'disable']
-        self.jobs_actions = ['list', 'status', 'resume', 'stop']
-        self.db_actions = ['stats', 'path']
-        self.web_providers = ['coconut', 'lotus', 'chembl', 'clinicaltrials', 'naeb', 'herb2', 'tcmsp', 'osadhi', 'imppat', 'msk', 'dukes']
+        # One trie per completion namespace, built once at REPL start
+        self.commands = _PrefixTrie(['search', 'find', 'pubmed', 'searchtheuniverse', 'read', 'open', 'sources', 'scrape', 'jobs', 'db', 'help', 'quit', 'exit'])
+        self.search_types = _PrefixTrie(['plant', 'ingredient', 'ailment', 'recipe', 'all'])
+        self.sources_actions = _PrefixTrie(['list', 'add', 'enable', 'disable'])
+        self.jobs_actions = _PrefixTrie(['list', 'status', 'resume', 'stop', 'watch'])
+        self.db_actions = _PrefixTrie(['stats', 'path'])
+        self.web_providers = _PrefixTrie(['coconut', 'lotus', 'chembl', 'clinicaltrials', 'naeb', 'herb2', 'tcmsp', 'osadhi', 'imppat', 'msk', 'dukes'])
+        # Scraper-source trie, rebuilt only when the registry's cached name
+        # tuple changes (registration invalidates it)
+        self._source_names = None
+        self._source_trie = _PrefixTrie()
+        # Dictionary suggestions memoized per (partial, dictionary version);
+        # version bumps on refresh, so stale entries just stop being hit.
+        self._autocomplete = lru_cache(maxsize=512)(
+            lambda partial, version: tuple(handler.search_engine.autocomplete(partial)))
+        # Dict dispatch on the head word replaces the old elif chain
+        self._handlers = {
+            'search': self._complete_search,
+            'searchtheuniverse': self._complete_websearch,
+            'sources': self._complete_sources,
+            'jobs': self._complete_jobs,
+            'db': self._complete_db,
+            'scrape': self._complete_scrape,
+        }
+    
+    def _sources(self) -> _PrefixTrie:
+        from ..scraper.sources import SourceRegistry
+        from .commands import _ensure_scrapers
+        # Crawler registration is deferred until a scrape/jobs command runs;
+        # completion must load it too or the registry lists nothing
+        _ensure_scrapers()
+        names = SourceRegistry.list_sources()
+        if names != self._source_names:
+            self._source_names = names
+            self._source_trie = _PrefixTrie(names)
+        return self._source_trie
     
     def get_completions(self, document, complete_event):
+        # Per-keystroke hot path: compute the head word and trailing-space
+        # flag once, then dispatch through the handler table
         text = document.text_before_cursor
         words = text.split()
+        trailing_space = text.endswith(' ')
         
         if not words:
-            for cmd in self.commands:
+            for cmd in self.commands.iter_prefix(''):
                 yield Completion(cmd, start_position=0)
-        elif len(words) == 1 and not text.endswith(' '):
+            return
+        if len(words) == 1 and not trailing_space:
             word = words[0].lower()
-            for cmd in self.commands:
-                if cmd.startswith(word):
-                    yield Completion(cmd, start_position=-len(word))
-        elif words[0].lower() == 'search':
-            if len(words) == 1 or (len(words) == 2 and not text.endswith(' ')):
-                prefix = words[1].lower() if len(words) > 1 else ''
-                for stype in self.search_types:
-                    if stype.startswith(prefix):
-                        yield Completion(stype, start_position=-len(prefix))
-            else:
-                partial = words[-1] if not text.endswith(' ') else ''
-                # Suggest --web flag
-                if partial.startswith('-'):
-                    if '--web'.startswith(partial):
-                        yield Completion('--web', start_position=-len(partial))
-                else:
-                    suggestions = self.handler.search_engine.autocomplete(partial)
-                    for suggestion in suggestions:
-                        yield Completion(suggestion, start_position=-len(partial))
-        elif words[0].lower() == 'searchtheuniverse':
-            # Check for --provider flag
-            if '--provider' in words or '-p' in words:
-                try:
-                    idx = words.index('--provider') if '--provider' in words else words.index('-p')
-                    if idx == len(words) - 1 or (idx == len(words) - 2 and not text.endswith(' ')):
-                        prefix = words[-1].lower() if idx < len(words) - 1 else ''
-                        for provider in self.web_providers:
-                            if provider.startswith(prefix):
-                                yield Completion(provider, start_position=-len(prefix))
-                except ValueError:
-                    pass
-        elif words[0].lower() == 'sources':
-            if len(words) == 1 or (len(words) == 2 and not text.endswith(' ')):
-                prefix = words[1].lower() if len(words) > 1 else ''
-                for action in self.sources_actions:
-                    if action.startswith(prefix):
-                        yield Completion(action, start_position=-len(prefix))
-        elif words[0].lower() == 'jobs':
-            if len(words) == 1 or (len(words) == 2 and not text.endswith(' ')):
-                prefix = words[1].lower() if len(words) > 1 else ''
-                for action in self.jobs_actions:
-                    if action.startswith(prefix):
-                        yield Completion(action, start_position=-len(prefix))
-        elif words[0].lower() == 'db':
-            if len(words) == 1 or (len(words) == 2 and not text.endswith(' ')):
-                prefix = words[1].lower() if len(words) > 1 else ''
-                for action in self.db_actions:
-                    if action.startswith(prefix):
-                        yield Completion(action, start_position=-len(prefix))
-        elif words[0].lower() == 'scrape':
-            if len(words) == 1 or (len(words) == 2 and not text.endswith(' ')):
-                prefix = words[1] if len(words) > 1 else ''
-                from ..scraper.sources import SourceRegistry
-                for source in SourceRegistry.list_sources():
-                    if source.lower().startswith(prefix.lower()):
-                        yield Completion(source, start_position=-len(prefix))
+            for cmd in self.commands.iter_prefix(word):
+                yield Completion(cmd, start_position=-len(word))
+            return
+        handle = self._handlers.get(words[0].lower())
+        if handle is not None:
+            yield from handle(words, trailing_space)
+    
+    def _complete_second(self, words, trailing_space, trie):
+        """Complete the second word of a command from a namespace trie."""
+        if len(words) == 1 or (len(words) == 2 and not trailing_space):
+            prefix = words[1].lower() if len(words) > 1 else ''
+            for entry in trie.iter_prefix(prefix):
+                yield Completion(entry, start_position=-len(prefix))
+    
+    def _complete_search(self, words, trailing_space):
+        if len(words) == 1 or (len(words) == 2 and not trailing_space):
+            yield from self._complete_second(words, trailing_space, self.search_types)
+            return
+        partial = words[-1] if not trailing_space else ''
+        # Suggest --web flag
+        if partial.startswith('-'):
+            if '--web'.startswith(partial):
+                yield Completion('--web', start_position=-len(partial))
+        else:
+            engine = self.handler.search_engine
+            suggestions = self._autocomplete(partial, engine._cache_version)
+            for suggestion in suggestions:
+                yield Completion(suggestion, start_position=-len(partial))
+    
+    def _complete_websearch(self, words, trailing_space):
+        # Check for --provider flag
+        if '--provider' in words or '-p' in words:
+            try:
+                idx = words.index('--provider') if '--provider' in words else words.index('-p')
+            except ValueError:
+                return
+            if idx == len(words) - 1 or (idx == len(words) - 2 and not trailing_space):
+                prefix = words[-1].lower() if idx < len(words) - 1 else ''
+                for provider in self.web_providers.iter_prefix(prefix):
+                    yield Completion(provider, start_position=-len(prefix))
+    
+    def _complete_sources(self, words, trailing_space):
+        return self._complete_second(words, trailing_space, self.sources_actions)
+    
+    def _complete_jobs(self, words, trailing_space):
+        return self._complete_second(words, trailing_space, self.jobs_actions)
+    
+    def _complete_db(self, words, trailing_space):
+        return self._complete_second(words, trailing_space, self.db_actions)
+    
+    def _complete_scrape(self, words, trailing_space):
+        if len(words) == 1 or (len(words) == 2 and not trailing_space):
+            prefix = words[1] if len(words) > 1 else ''
+            for source in self._sources().iter_prefix(prefix):
+                yield Completion(source, start_position=-len(prefix))
+
+
+# Lines of spell_history.txt kept across sessions; FileHistory scans the
+# whole file, so unbounded growth eventually drags on startup
+_HISTORY_MAX_LINES = 5000
+
+
+def _trim_history(path: Path, max_lines: int = _HISTORY_MAX_LINES):
+    """Drop all but the tail of an oversized history file.
+
+    FileHistory entries span multiple lines (a '# timestamp' header plus
+    '+' payload lines), so after slicing the tail we skip forward to the
+    next header to avoid leaving a truncated entry at the top.
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            lines = f.readlines()
+        if len(lines) <= max_lines:
+            return
+        tail = lines[-max_lines:]
+        for i, line in enumerate(tail):
+            if line.startswith('# '):
+                tail = tail[i:]
+                break
+        with open(path, 'w', encoding='utf-8') as f:
+            f.writelines(tail)
+    except OSError:
+        pass
 
 
 class GrimmoireREPL:
@@ -231,24 +334,41 @@ class GrimmoireREPL:
         self.console = Console(theme=WITCHY_THEME)
         self.db = DatabaseManager(db_path)
         self.handler = CommandHandler(self.db, self.console)
-        
+        # (hour bucket, HTML prompt): rebuilt only when the moon turns
+        self._prompt_cache = (None, None)
+
         history_path = get_db_path().parent / "spell_history.txt"
+        # Session machinery is only needed once the prompt loop starts, so
+        # these stay out of the module import path (help/--version callers)
+        from prompt_toolkit import PromptSession
+        from prompt_toolkit.history import FileHistory, ThreadedHistory
+        from prompt_toolkit.auto_suggest import AutoSuggestFromHistory
+        # Cap the file so old sessions can't slow scans down, and load it
+        # off-thread so the first prompt never blocks on history I/O
+        _trim_history(history_path)
         self.session = PromptSession(
-            history=FileHistory(str(history_path)),
+            history=ThreadedHistory(FileHistory(str(history_path))),
             auto_suggest=AutoSuggestFromHistory(),
             completer=GrimmoireCompleter(self.handler)
         )
     
     def _get_prompt(self) -> HTML:
         """Get a witchy prompt with moon phase indicator."""
-        moons = ['🌑', '🌒', '🌓', '🌔', '🌕', '🌖', '🌗', '🌘']
-        import time
-        moon = moons[int(time.time() / 3600) % 8]  # Changes hourly
-        return HTML(f'\n{moon} <b><magenta>grimmoire</magenta></b> <green>⌁</green> ')
+        hour = int(time.time() / 3600)  # Moon changes hourly
+        cached_hour, cached_prompt = self._prompt_cache
+        if hour != cached_hour:
+            moon = _MOON_PHASES[hour % 8]
+            cached_prompt = HTML(f'\n{moon} <b><magenta>grimmoire</magenta></b> <green>⌁</green> ')
+            self._prompt_cache = (hour, cached_prompt)
+        return cached_prompt
     
     def run(self):
         """Run the REPL main loop."""
-        self.console.print(BANNER)
+        # Parse the banner markup once per process; reprints reuse the Text
+        global _BANNER_RENDERABLE
+        if _BANNER_RENDERABLE is None:
+            _BANNER_RENDERABLE = Text.from_markup(BANNER)
+        self.console.print(_BANNER_RENDERABLE)
         
         # Show quick stats with witchy flair
         stats = self.db.get_stats()
@@ -299,6 +419,8 @@ class GrimmoireREPL:
         
         farewell = random.choice(FAREWELL_MESSAGES)
         magic_print(f"\n✨ {farewell}\n")
+        from ..search.web_provider import close_shared_session
+        close_shared_session()
         self.db.close()
     
     def _handle_command(self, command: str, args: List[str]) -> Optional[CommandResult]:
@@ -308,7 +430,13 @@ class GrimmoireREPL:
             return None
         
         elif command == 'help':
-            self.console.print(Markdown(HELP_TEXT))
+            # rich.markdown costs ~45ms to import; only the help command pays,
+            # and the parsed Markdown is kept for repeat invocations
+            global _HELP_RENDERABLE
+            if _HELP_RENDERABLE is None:
+                from rich.markdown import Markdown
+                _HELP_RENDERABLE = Markdown(HELP_TEXT)
+            self.console.print(_HELP_RENDERABLE)
             return CommandResult(True)
         
         elif command == 'search':
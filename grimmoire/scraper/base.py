@@ -1,11 +1,24 @@
 """Base scraper class for data sources."""
 import time
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+
+try:  # same optional speedup as db.manager: C-level parse of API payloads
+    import orjson
+
+    def _loads(payload: bytes):
+        return orjson.loads(payload)
+except ImportError:
+    import json
+
+    def _loads(payload: bytes):
+        return json.loads(payload)
 from abc import ABC, abstractmethod
 from typing import Generator, Any, Optional, List, Dict
 from dataclasses import dataclass, field
 
-from ..db.manager import DatabaseManager
+from ..db.manager import DatabaseManager, _dump_json
 
 
 @dataclass
@@ -26,6 +39,11 @@ class ScraperProgress:
             'errors': self.errors[-10:]
         }
     
+    def to_json(self):
+        """to_dict() serialized once here; DB writers store it verbatim
+        instead of re-encoding the dict per journal/progress write."""
+        return _dump_json(self.to_dict())
+    
     @classmethod
     def from_dict(cls, data: dict) -> 'ScraperProgress':
         return cls(
@@ -47,33 +65,51 @@ class BaseScraper(ABC):
         self.progress = ScraperProgress()
         self.rate_limit = self.config.get('rate_limit', 1.0)
         self.last_request = 0
+        self._rate_lock = threading.Lock()
+        # Pooled session: keep-alive/TLS reuse across the hundreds of page
+        # fetches a scrape makes, and enough connections for parallel fetchers
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=8)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self._stop_requested = False
         self.source_id = self._get_source_id()
     
     def _get_source_id(self) -> Optional[int]:
-        sources = self.db.get_sources()
-        for source in sources:
-            if source['name'] == self.source_name:
-                return source['id']
-        return None
+        return self.db.get_source_id(self.source_name)
     
     def _rate_limit(self):
-        now = time.time()
+        """Reserve the next request slot; safe for concurrent fetchers.
+
+        The lock only covers slot accounting, so parallel workers queue up
+        future slots and sleep outside the lock — a shared rate budget
+        rather than a serializing bottleneck.
+        """
         min_interval = 1.0 / self.rate_limit
-        elapsed = now - self.last_request
-        if elapsed < min_interval:
-            time.sleep(min_interval - elapsed)
-        self.last_request = time.time()
+        with self._rate_lock:
+            now = time.time()
+            wait = self.last_request + min_interval - now
+            if wait > 0:
+                self.last_request += min_interval
+            else:
+                self.last_request = now
+        if wait > 0:
+            time.sleep(wait)
     
     def _make_request(self, url: str, params: dict = None, headers: dict = None) -> requests.Response:
         self._rate_limit()
         default_headers = {'User-Agent': 'Grimmoire/0.1 (Traditional Medicine Research Tool)'}
         if headers:
             default_headers.update(headers)
-        response = requests.get(url, params=params, headers=default_headers, timeout=30)
+        response = self.session.get(url, params=params, headers=default_headers, timeout=30)
         response.raise_for_status()
         return response
     
+    @staticmethod
+    def _json(response: requests.Response):
+        """Decode a JSON response body via orjson when available."""
+        return _loads(response.content)
+    
     def request_stop(self):
         self._stop_requested = True
     
@@ -102,11 +138,24 @@ class BaseScraper(ABC):
             return self.db.add_recipe(**item)
         return 0
     
+    # Items per write transaction in run(); one commit per batch instead of
+    # one per row is what makes large scrapes I/O-bound on the network again.
+    FLUSH_EVERY = 500
+    
+    def _flush_buffer(self, buffer: List[tuple]):
+        if not buffer:
+            return
+        with self.db.transaction():
+            for entity_type, item in buffer:
+                self.save_item(item, entity_type)
+        buffer.clear()
+    
     def run(self, resume_from: ScraperProgress = None, callback: callable = None) -> ScraperProgress:
         """Run the full scraping process."""
         self._stop_requested = False
         self.progress = resume_from or ScraperProgress()
         
+        buffer: List[tuple] = []
         try:
             for item in self.scrape(resume_from):
                 if self.should_stop():
@@ -115,8 +164,10 @@ class BaseScraper(ABC):
                     processed = self.process_item(item)
                     if processed:
                         entity_type = processed.pop('_type', 'plant')
-                        self.save_item(processed, entity_type)
+                        buffer.append((entity_type, processed))
                         self.progress.processed_items += 1
+                        if len(buffer) >= self.FLUSH_EVERY:
+                            self._flush_buffer(buffer)
                 except Exception as e:
                     self.progress.errors.append(str(e))
                 
@@ -124,5 +175,10 @@ class BaseScraper(ABC):
                     callback(item, self.progress)
         except Exception as e:
             self.progress.errors.append(f"Fatal error: {str(e)}")
+        finally:
+            try:
+                self._flush_buffer(buffer)
+            except Exception as e:
+                self.progress.errors.append(f"Flush error: {str(e)}")
         
         return self.progress
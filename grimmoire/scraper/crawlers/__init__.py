@@ -1,2 +1,5 @@
-"""Crawler implementations"""
-from . import naeb  # Register scrapers on import
+"""Crawler implementations.
+
+Modules here are imported lazily (see repl.commands._ensure_scrapers),
+which registers each scraper with SourceRegistry on first use.
+"""
@@ -1,5 +1,8 @@
 """NAEB (Native American Ethnobotany Database) and PubChem scrapers."""
-from typing import Generator, Optional, List, Dict
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Generator, Optional, List, Dict, Tuple
 
 from ..base import BaseScraper, ScraperProgress
 from ..sources import register_scraper
@@ -10,50 +13,70 @@ class NAEBScraper(BaseScraper):
     """Scraper for Native American Ethnobotany Database via Datasette API."""
     
     BASE_URL = "https://naeb.louispotok.com"
-    PAGE_SIZE = 100
+    # Datasette serves up to 1000 rows per page; bigger pages mean 10x fewer
+    # round-trips, and peak memory stays bounded at FETCH_WORKERS pages
+    PAGE_SIZE = 1000
+    # Parallel page fetchers; network latency overlaps with item processing
+    FETCH_WORKERS = 4
     
     def get_table_count(self, table: str) -> int:
         url = f"{self.BASE_URL}/naeb/{table}.json"
         params = {'_size': 0}
         response = self._make_request(url, params)
-        data = response.json()
+        data = self._json(response)
         return data.get('filtered_table_rows_count', 0) or len(data.get('rows', []))
     
     def fetch_page(self, table: str, offset: int = 0) -> List[Dict]:
         url = f"{self.BASE_URL}/naeb/{table}.json"
         params = {'_size': self.PAGE_SIZE, '_offset': offset}
         response = self._make_request(url, params)
-        data = response.json()
+        data = self._json(response)
         return data.get('rows', [])
     
+    def _iter_pages(self, table: str, total: int,
+                    start_offset: int = 0) -> Generator[Tuple[int, List[Dict]], None, None]:
+        """Yield (offset, rows) in offset order with pages prefetched.
+
+        Keeps up to FETCH_WORKERS page requests in flight so the next pages
+        download while the caller processes the current one; the shared rate
+        limiter in BaseScraper still bounds the aggregate request rate.
+        """
+        offsets = iter(range(start_offset, total, self.PAGE_SIZE))
+        with ThreadPoolExecutor(max_workers=self.FETCH_WORKERS) as pool:
+            pending = deque(
+                (off, pool.submit(self.fetch_page, table, off))
+                for off in islice(offsets, self.FETCH_WORKERS)
+            )
+            while pending:
+                offset, future = pending.popleft()
+                rows = future.result()
+                if not self.should_stop():
+                    nxt = next(offsets, None)
+                    if nxt is not None:
+                        pending.append((nxt, pool.submit(self.fetch_page, table, nxt)))
+                yield offset, rows
+                if self.should_stop():
+                    break
+    
     def fetch_species(self) -> Generator[Dict, None, None]:
         total = self.get_table_count('species')
         self.progress.total_items = total
-        offset = self.progress.current_page * self.PAGE_SIZE
+        start = self.progress.current_page * self.PAGE_SIZE
         
-        while offset < total:
-            if self.should_stop():
-                break
-            rows = self.fetch_page('species', offset)
+        for offset, rows in self._iter_pages('species', total, start):
             if not rows:
                 break
             for row in rows:
                 yield {'table': 'species', 'data': row}
-            offset += self.PAGE_SIZE
-            self.progress.current_page = offset // self.PAGE_SIZE
+            self.progress.current_page = offset // self.PAGE_SIZE + 1
     
     def fetch_uses(self) -> Generator[Dict, None, None]:
         total = self.get_table_count('uses')
-        offset = 0
-        while offset < total:
-            if self.should_stop():
-                break
-            rows = self.fetch_page('uses', offset)
+        for offset, rows in self._iter_pages('uses', total):
             if not rows:
                 break
             for row in rows:
                 yield {'table': 'uses', 'data': row}
-            offset += self.PAGE_SIZE
     
     def scrape(self, resume_from: ScraperProgress = None) -> Generator[Dict, None, None]:
         if resume_from:
@@ -100,7 +123,7 @@ class PubChemScraper(BaseScraper):
         url = f"{self.BASE_URL}/compound/name/{query}/cids/JSON"
         try:
             response = self._make_request(url)
-            data = response.json()
+            data = self._json(response)
             return data.get('IdentifierList', {}).get('CID', [])[:max_results]
         except Exception:
             return []
@@ -112,22 +135,24 @@ class PubChemScraper(BaseScraper):
         url = f"{self.BASE_URL}/compound/cid/{cid_str}/property/MolecularFormula,MolecularWeight,IsomericSMILES,InChIKey,IUPACName/JSON"
         try:
             response = self._make_request(url)
-            data = response.json()
+            data = self._json(response)
             return data.get('PropertyTable', {}).get('Properties', [])
         except Exception:
             return []
     
-    def get_compound_synonyms(self, cid: int) -> List[str]:
-        url = f"{self.BASE_URL}/compound/cid/{cid}/synonyms/JSON"
+    def get_compound_synonyms(self, cids: List[int]) -> Dict[int, List[str]]:
+        """Fetch synonyms for up to 100 CIDs in one call, keyed by CID."""
+        if not cids:
+            return {}
+        cid_str = ','.join(map(str, cids[:100]))
+        url = f"{self.BASE_URL}/compound/cid/{cid_str}/synonyms/JSON"
         try:
             response = self._make_request(url)
-            data = response.json()
+            data = self._json(response)
             info = data.get('InformationList', {}).get('Information', [])
-            if info:
-                return info[0].get('Synonym', [])[:10]
+            return {entry.get('CID'): entry.get('Synonym', [])[:10] for entry in info}
         except Exception:
-            pass
-        return []
+            return {}
     
     def scrape(self, resume_from: ScraperProgress = None) -> Generator[Dict, None, None]:
         if resume_from:
@@ -143,17 +168,31 @@ class PubChemScraper(BaseScraper):
         
         self.progress.total_items = len(compounds_to_search)
         
+        # Resolve names to CIDs first, then batch the property and synonym
+        # lookups 100 CIDs per request instead of one round-trip per CID
+        all_cids: List[tuple] = []
+        seen = set()
         for i, compound_name in enumerate(compounds_to_search):
             if self.should_stop():
                 break
-            cids = self.search_compounds(compound_name, max_results=5)
-            for cid in cids:
-                props_list = self.get_compound_properties([cid])
-                if props_list:
-                    props = props_list[0]
-                    synonyms = self.get_compound_synonyms(cid)
-                    yield {'cid': cid, 'name': compound_name, 'properties': props, 'synonyms': synonyms}
+            for cid in self.search_compounds(compound_name, max_results=5):
+                if cid not in seen:
+                    seen.add(cid)
+                    all_cids.append((cid, compound_name))
             self.progress.processed_items = i + 1
+        
+        for start in range(0, len(all_cids), 100):
+            if self.should_stop():
+                break
+            chunk = all_cids[start:start + 100]
+            cids = [cid for cid, _ in chunk]
+            props_by_cid = {p.get('CID'): p for p in self.get_compound_properties(cids)}
+            synonyms_by_cid = self.get_compound_synonyms(cids)
+            for cid, compound_name in chunk:
+                props = props_by_cid.get(cid)
+                if props:
+                    yield {'cid': cid, 'name': compound_name, 'properties': props,
+                           'synonyms': synonyms_by_cid.get(cid, [])}
     
     def process_item(self, item: Dict) -> Optional[Dict]:
         props = item.get('properties', {})
@@ -1,5 +1,5 @@
 """Source registry for managing data source scrapers."""
-from typing import Type, Dict, Optional, List
+from typing import Type, Dict, Optional, Tuple
 from .base import BaseScraper
 from ..db.manager import DatabaseManager
 
@@ -8,10 +8,14 @@ class SourceRegistry:
     """Registry of available data source scrapers."""
     
     _scrapers: Dict[str, Type[BaseScraper]] = {}
+    # Sorted name tuple, built lazily and invalidated on register; callers
+    # like 'scrape' with no args list sources without a fresh allocation.
+    _names: Optional[Tuple[str, ...]] = None
     
     @classmethod
     def register(cls, name: str, scraper_class: Type[BaseScraper]):
         cls._scrapers[name] = scraper_class
+        cls._names = None
     
     @classmethod
     def get_scraper(cls, name: str, db: DatabaseManager, config: dict = None) -> Optional[BaseScraper]:
@@ -21,8 +25,10 @@ class SourceRegistry:
         return None
     
     @classmethod
-    def list_sources(cls) -> List[str]:
-        return list(cls._scrapers.keys())
+    def list_sources(cls) -> Tuple[str, ...]:
+        if cls._names is None:
+            cls._names = tuple(sorted(cls._scrapers))
+        return cls._names
     
     @classmethod
     def has_scraper(cls, name: str) -> bool:
@@ -1,4 +1,6 @@
 """Search engine for Grimmoire."""
+import time
+from functools import lru_cache
 from typing import Any, Optional, List, Tuple, Dict
 from enum import Enum
 
@@ -18,6 +20,22 @@ class SearchType(str, Enum):
     ALL = "all"
 
 
+def _fts_match_query(query: str) -> str:
+    """Translate a raw user query into FTS5 MATCH syntax.
+
+    Each whitespace-separated token is double-quoted so user input can never
+    be parsed as FTS5 operators (NEAR, -, ^, etc.), tokens are implicitly
+    ANDed, and the last token gets a * so partially typed words still match
+    (served by the prefix indexes on the FTS tables).
+    """
+    tokens = [t.replace('"', '""') for t in query.split()]
+    if not tokens:
+        return '""'
+    phrases = [f'"{t}"' for t in tokens]
+    phrases[-1] += '*'
+    return ' '.join(phrases)
+
+
 # Map SearchType to web SourceType
 _TYPE_MAP = {
     SearchType.PLANT: SourceType.PLANT,
@@ -66,6 +84,12 @@ class SearchEngine:
         self.spellchecker = SpellChecker()
         self.web_fallback = web_fallback
         self.web_aggregator = WebSearchAggregator(web_config) if web_fallback else None
+        # Bumping the version is how scrapes invalidate _cached_search: the
+        # old keys simply stop matching and age out of the LRU.
+        self._cache_version = 0
+        # TTL cache for web-only searches: unlike local results these go
+        # stale on the server's schedule, so entries expire after 5 minutes.
+        self._web_cache: Dict[tuple, tuple] = {}
         self._load_dictionary()
     
     def _load_dictionary(self):
@@ -74,6 +98,10 @@ class SearchEngine:
     
     def refresh_dictionary(self):
         self._load_dictionary()
+        self.invalidate_cache()
+    
+    def invalidate_cache(self):
+        self._cache_version += 1
     
     def search(self, query: str, search_type: SearchType = SearchType.ALL,
                limit: int = 20, correct_spelling: bool = True,
@@ -90,6 +118,27 @@ class SearchEngine:
         Returns:
             Tuple of (results list, spelling suggestion or None)
         """
+        if include_web is True:
+            # Forced web searches always go out fresh; never cache them
+            results, suggestion = self._search_impl(query, search_type, limit,
+                                                    correct_spelling, True)
+        else:
+            results, suggestion = self._cached_search(query, search_type, limit,
+                                                      correct_spelling, include_web,
+                                                      self._cache_version)
+        # Log every invocation, cache hit or not, so search_history stays complete
+        self.db.log_search(query, suggestion, search_type.value, len(results))
+        return list(results), suggestion
+    
+    @lru_cache(maxsize=256)
+    def _cached_search(self, query: str, search_type: SearchType, limit: int,
+                       correct_spelling: bool, include_web: Optional[bool],
+                       version: int) -> Tuple[List[SearchResult], Optional[str]]:
+        return self._search_impl(query, search_type, limit, correct_spelling, include_web)
+    
+    def _search_impl(self, query: str, search_type: SearchType, limit: int,
+                     correct_spelling: bool,
+                     include_web: Optional[bool]) -> Tuple[List[SearchResult], Optional[str]]:
         original_query = query
         suggestion = None
         
@@ -101,31 +150,32 @@ class SearchEngine:
         
         results = []
         
-        # Local search
+        # Local search goes through FTS5; sanitize the query once here
+        fts_query = _fts_match_query(query)
         if search_type in (SearchType.ALL, SearchType.PLANT):
             try:
-                plants = self.db.search_plants(query, limit)
+                plants = self.db.search_plants(fts_query, limit)
                 results.extend([SearchResult("plant", p, "local") for p in plants])
             except Exception:
                 pass
         
         if search_type in (SearchType.ALL, SearchType.INGREDIENT):
             try:
-                ingredients = self.db.search_ingredients(query, limit)
+                ingredients = self.db.search_ingredients(fts_query, limit)
                 results.extend([SearchResult("ingredient", i, "local") for i in ingredients])
             except Exception:
                 pass
         
         if search_type in (SearchType.ALL, SearchType.AILMENT):
             try:
-                ailments = self.db.search_ailments(query, limit)
+                ailments = self.db.search_ailments(fts_query, limit)
                 results.extend([SearchResult("ailment", a, "local") for a in ailments])
             except Exception:
                 pass
         
         if search_type in (SearchType.ALL, SearchType.RECIPE):
             try:
-                recipes = self.db.search_recipes(query, limit)
+                recipes = self.db.search_recipes(fts_query, limit)
                 results.extend([SearchResult("recipe", r, "local") for r in recipes])
             except Exception:
                 pass
@@ -140,15 +190,24 @@ class SearchEngine:
             web_results = self._search_web(original_query, search_type, limit - len(results))
             results.extend(web_results)
         
-        self.db.log_search(original_query, suggestion, search_type.value, len(results))
-        
         if not results and not suggestion:
-            suggestion = self.spellchecker.did_you_mean(original_query, 0)
+            # Substring hit via the trigram index first (catches partial
+            # names like 'lavend'); fall back to fuzzy match for true typos.
+            matches = self.db.suggest_names(original_query)
+            if matches:
+                suggestion = matches[0]
+            else:
+                suggestion = self.spellchecker.did_you_mean(original_query, 0)
         
         return results[:limit], suggestion
     
-    def _search_web(self, query: str, search_type: SearchType, limit: int) -> List[SearchResult]:
-        """Search web providers."""
+    def _search_web(self, query: str, search_type: SearchType, limit: int,
+                    on_results=None) -> List[SearchResult]:
+        """Search web providers.
+
+        `on_results`, when given, receives each provider's converted batch
+        as that provider finishes, for callers that render incrementally.
+        """
         if not self.web_aggregator:
             return []
         
@@ -158,15 +217,43 @@ class SearchEngine:
             source_type = _TYPE_MAP.get(search_type)
             source_types = [source_type] if source_type else None
         
+        on_batch = None
+        if on_results:
+            on_batch = lambda batch: on_results([SearchResult.from_web_result(r) for r in batch])
         try:
-            web_results = self.web_aggregator.search(query, source_types, limit)
+            web_results = self.web_aggregator.search(query, source_types, limit,
+                                                     on_batch=on_batch)
             return [SearchResult.from_web_result(r) for r in web_results]
         except Exception:
             return []
     
+    _WEB_CACHE_TTL = 300
+    _WEB_CACHE_MAX = 128
+
     def search_web_only(self, query: str, search_type: SearchType = SearchType.ALL,
-                        limit: int = 20, providers: List[str] = None) -> List[SearchResult]:
-        """Search only web providers (bypass local database)."""
+                        limit: int = 20, providers: List[str] = None,
+                        on_results=None) -> List[SearchResult]:
+        """Search only web providers (bypass local database).
+
+        Cache hits return at once (no `on_results` calls); on a miss each
+        provider's batch is delivered via `on_results` as it arrives.
+        """
+        key = (query.lower(), search_type, limit,
+               tuple(providers) if providers else None, self._cache_version)
+        cached = self._web_cache.get(key)
+        now = time.time()
+        if cached and now - cached[0] < self._WEB_CACHE_TTL:
+            return list(cached[1])
+        results = self._search_web_only_impl(query, search_type, limit, providers, on_results)
+        if len(self._web_cache) >= self._WEB_CACHE_MAX:
+            oldest = min(self._web_cache, key=lambda k: self._web_cache[k][0])
+            del self._web_cache[oldest]
+        self._web_cache[key] = (now, results)
+        return list(results)
+
+    def _search_web_only_impl(self, query: str, search_type: SearchType,
+                              limit: int, providers: List[str] = None,
+                              on_results=None) -> List[SearchResult]:
         if not self.web_aggregator:
             self.web_aggregator = WebSearchAggregator({"providers": providers} if providers else None)
         
@@ -174,11 +261,11 @@ class SearchEngine:
             # Temporarily override providers
             old_providers = self.web_aggregator.enabled_providers
             self.web_aggregator.enabled_providers = providers
-            results = self._search_web(query, search_type, limit)
+            results = self._search_web(query, search_type, limit, on_results)
             self.web_aggregator.enabled_providers = old_providers
             return results
         
-        return self._search_web(query, search_type, limit)
+        return self._search_web(query, search_type, limit, on_results)
     
     def search_by_relationship(self, entity_type: str, entity_id: int, target_type: str) -> List[SearchResult]:
         """Search for related entities."""
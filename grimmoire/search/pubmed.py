@@ -1,7 +1,10 @@
 """PubMed integration via NCBI E-utilities."""
+import os
 import time
 import requests
-from typing import Optional, List, Dict
+from io import BytesIO
+from requests.adapters import HTTPAdapter, Retry
+from typing import Optional, List, Dict, Iterator
 from xml.etree import ElementTree
 
 
@@ -9,12 +12,48 @@ class PubMedClient:
     """Client for searching PubMed via NCBI E-utilities."""
     
     BASE_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils"
+    # NCBI recommends at most 200 PMIDs per efetch/esummary call; larger
+    # requests stall or time out server-side.
+    EFETCH_BATCH = 200
     
-    def __init__(self, api_key: str = None, email: str = None):
-        self.api_key = api_key
+    def __init__(self, api_key: str = None, email: str = None,
+                 session: requests.Session = None):
+        # NCBI allows 10 req/s with a key vs 3 without; honor the standard
+        # NCBI_API_KEY env var when no key is passed explicitly.
+        self.api_key = api_key or os.environ.get('NCBI_API_KEY')
         self.email = email
-        self.rate_limit = 10 if api_key else 3
+        self.rate_limit = 10 if self.api_key else 3
         self.last_request = 0
+        # One Session for the client's lifetime: every search is 2-3 requests
+        # to the same host, and connection pooling skips the TCP + TLS
+        # handshake on all but the first. Retries cover NCBI's transient
+        # 429s. A caller may inject an already-pooled session (the REPL
+        # shares one across PubMed and the web providers); the client only
+        # closes a session it built itself.
+        self._owns_session = session is None
+        if session is not None:
+            self._session = session
+        else:
+            self._session = requests.Session()
+            self._session.mount("https://", HTTPAdapter(
+                pool_connections=4, pool_maxsize=10,
+                max_retries=Retry(total=3, backoff_factor=0.5,
+                                  status_forcelist=[429, 500, 502, 503, 504])
+            ))
+            self._session.headers.update({
+                'User-Agent': 'grimmoire (herbal research CLI)',
+                'Accept': 'application/json, text/xml',
+            })
+
+    def close(self):
+        if self._owns_session:
+            self._session.close()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
     
     def _rate_limit(self):
         now = time.time()
@@ -30,14 +69,14 @@ class PubMedClient:
             params['api_key'] = self.api_key
         if self.email:
             params['email'] = self.email
-        response = requests.get(f"{self.BASE_URL}/{endpoint}", params=params, timeout=30)
+        response = self._session.get(f"{self.BASE_URL}/{endpoint}", params=params, timeout=30)
         response.raise_for_status()
         return response
     
     def search(self, query: str, max_results: int = 20, retstart: int = 0) -> Dict:
         """Search PubMed and return PMIDs."""
         params = {
-            'db': 'pubmed', 'term': query, 'retmax': max_results,
+            'db': 'pubmed', 'term': query, 'retmax': min(max_results, 9999),
             'retstart': retstart, 'retmode': 'json', 'usehistory': 'y'
         }
         response = self._make_request('esearch.fcgi', params)
@@ -50,17 +89,27 @@ class PubMedClient:
             'query_key': result.get('querykey')
         }
     
-    def fetch_summaries(self, pmids: List[str]) -> List[Dict]:
-        """Fetch article summaries for given PMIDs."""
-        if not pmids:
+    def fetch_summaries(self, pmids: List[str], web_env: str = None,
+                        query_key: str = None, max_results: int = 20,
+                        retstart: int = 0) -> List[Dict]:
+        """Fetch article summaries for given PMIDs.
+
+        When the esearch history handle (web_env/query_key) is available,
+        the PMID list lives server-side and is not re-uploaded.
+        """
+        if web_env and query_key:
+            params = {'db': 'pubmed', 'WebEnv': web_env, 'query_key': query_key,
+                      'retstart': retstart, 'retmax': max_results, 'retmode': 'json'}
+        elif pmids:
+            params = {'db': 'pubmed', 'id': ','.join(pmids), 'retmode': 'json'}
+        else:
             return []
-        params = {'db': 'pubmed', 'id': ','.join(pmids), 'retmode': 'json'}
         response = self._make_request('esummary.fcgi', params)
         data = response.json()
         
         results = []
         result_data = data.get('result', {})
-        for pmid in pmids:
+        for pmid in pmids or result_data.get('uids', []):
             if pmid in result_data:
                 article = result_data[pmid]
                 results.append({
@@ -74,21 +123,33 @@ class PubMedClient:
                 })
         return results
     
-    def fetch_abstracts(self, pmids: List[str]) -> Dict[str, str]:
-        """Fetch abstracts for given PMIDs."""
-        if not pmids:
+    def fetch_abstracts(self, pmids: List[str], web_env: str = None,
+                        query_key: str = None, max_results: int = 20,
+                        retstart: int = 0) -> Dict[str, str]:
+        """Fetch abstracts for given PMIDs (or an esearch history handle)."""
+        if web_env and query_key:
+            params = {'db': 'pubmed', 'WebEnv': web_env, 'query_key': query_key,
+                      'retstart': retstart, 'retmax': max_results,
+                      'rettype': 'abstract', 'retmode': 'xml'}
+        elif pmids:
+            params = {'db': 'pubmed', 'id': ','.join(pmids), 'rettype': 'abstract', 'retmode': 'xml'}
+        else:
             return {}
-        params = {'db': 'pubmed', 'id': ','.join(pmids), 'rettype': 'abstract', 'retmode': 'xml'}
         response = self._make_request('efetch.fcgi', params)
         
+        # Stream the XML instead of materializing the whole DOM: each
+        # PubmedArticle element is inspected and freed as soon as its end tag
+        # arrives, keeping peak memory at one article however large the batch.
         abstracts = {}
         try:
-            root = ElementTree.fromstring(response.content)
-            for article in root.findall('.//PubmedArticle'):
-                pmid_elem = article.find('.//PMID')
-                abstract_elem = article.find('.//AbstractText')
+            for _, elem in ElementTree.iterparse(BytesIO(response.content)):
+                if elem.tag != 'PubmedArticle':
+                    continue
+                pmid_elem = elem.find('.//PMID')
+                abstract_elem = elem.find('.//AbstractText')
                 if pmid_elem is not None and abstract_elem is not None:
                     abstracts[pmid_elem.text] = abstract_elem.text or ''
+                elem.clear()
         except ElementTree.ParseError:
             pass
         return abstracts
@@ -99,19 +160,45 @@ class PubMedClient:
                 return id_item.get('value')
         return None
     
-    def search_herbs(self, herb_name: str, max_results: int = 20) -> List[Dict]:
-        """Search for research on a specific herb."""
+    def _iter_articles(self, search_result: Dict) -> Iterator[Dict]:
+        """Yield summary+abstract dicts for an esearch result, batch by batch.
+
+        Rides the history server (WebEnv/query_key from usehistory=y) and
+        walks the result set in EFETCH_BATCH slices so a max_results above
+        200 issues several fast calls instead of one call NCBI will stall.
+        _rate_limit already paces consecutive calls (3/s, 10/s with a key).
+        Articles are yielded as each batch lands, so a caller rendering
+        incrementally shows the first page while later ones are in flight.
+        """
+        ids = search_result['ids']
+        web_env = search_result.get('web_env')
+        query_key = search_result.get('query_key')
+        for start in range(0, len(ids), self.EFETCH_BATCH):
+            batch_ids = ids[start:start + self.EFETCH_BATCH]
+            batch = self.fetch_summaries(batch_ids, web_env, query_key,
+                                         max_results=len(batch_ids), retstart=start)
+            if not batch:
+                break
+            abstracts = self.fetch_abstracts(batch_ids, web_env, query_key,
+                                             max_results=len(batch_ids), retstart=start)
+            for summary in batch:
+                summary['abstract'] = abstracts.get(summary['pmid'], '')
+                yield summary
+
+    def _fetch_articles(self, search_result: Dict, max_results: int) -> List[Dict]:
+        return list(self._iter_articles(search_result))
+
+    def iter_search_herbs(self, herb_name: str, max_results: int = 20) -> Iterator[Dict]:
+        """Like search_herbs, but yield articles as their batches arrive."""
         query = f'"{herb_name}"[Title/Abstract] AND ("Plants, Medicinal"[MeSH] OR "Phytotherapy"[MeSH] OR "Herbal Medicine"[MeSH])'
         search_result = self.search(query, max_results)
         if not search_result['ids']:
             search_result = self.search(f'"{herb_name}" herb OR medicinal', max_results)
-        
-        summaries = self.fetch_summaries(search_result['ids'])
-        if summaries:
-            abstracts = self.fetch_abstracts(search_result['ids'])
-            for summary in summaries:
-                summary['abstract'] = abstracts.get(summary['pmid'], '')
-        return summaries
+        return self._iter_articles(search_result)
+
+    def search_herbs(self, herb_name: str, max_results: int = 20) -> List[Dict]:
+        """Search for research on a specific herb."""
+        return list(self.iter_search_herbs(herb_name, max_results))
     
     def search_ailment_treatment(self, ailment: str, treatment: str = None, max_results: int = 20) -> List[Dict]:
         """Search for treatments of an ailment."""
@@ -121,20 +208,10 @@ class PubMedClient:
             query = f'"{ailment}"[Title/Abstract] AND ("Phytotherapy"[MeSH] OR "Plant Extracts"[MeSH] OR "Herbal Medicine"[MeSH])'
         
         search_result = self.search(query, max_results)
-        summaries = self.fetch_summaries(search_result['ids'])
-        if summaries:
-            abstracts = self.fetch_abstracts(search_result['ids'])
-            for summary in summaries:
-                summary['abstract'] = abstracts.get(summary['pmid'], '')
-        return summaries
+        return self._fetch_articles(search_result, max_results)
     
     def search_compound(self, compound_name: str, max_results: int = 20) -> List[Dict]:
         """Search for research on a specific compound."""
         query = f'"{compound_name}"[Title/Abstract] AND ("Phytochemicals"[MeSH] OR "Plant Extracts"[MeSH] OR "Natural Products")'
         search_result = self.search(query, max_results)
-        summaries = self.fetch_summaries(search_result['ids'])
-        if summaries:
-            abstracts = self.fetch_abstracts(search_result['ids'])
-            for summary in summaries:
-                summary['abstract'] = abstracts.get(summary['pmid'], '')
-        return summaries
+        return self._fetch_articles(search_result, max_results)
@@ -1,8 +1,11 @@
 """Web search providers for querying online traditional medicine databases."""
 import time
 import requests
+from requests.adapters import HTTPAdapter, Retry
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional, Any
+from functools import lru_cache
+from typing import List, Dict, Optional, Any, Callable
 from dataclasses import dataclass, field
 from enum import Enum
 
@@ -37,6 +40,41 @@ class WebSearchResult:
         }
 
 
+_shared_session: Optional[requests.Session] = None
+
+
+def get_shared_session() -> requests.Session:
+    """One pooled Session shared by every provider (and the PubMed client).
+
+    All providers talk HTTPS to a handful of hosts; sharing the pool keeps
+    connections alive across commands, so repeat searches skip the TCP and
+    TLS handshakes. Retries cover the transient 429/5xx the public
+    endpoints throw under load.
+    """
+    global _shared_session
+    if _shared_session is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10, pool_maxsize=30,
+            max_retries=Retry(total=3, backoff_factor=0.5,
+                              status_forcelist=[429, 500, 502, 503, 504])
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update({
+            'User-Agent': 'Grimmoire/0.1 (Traditional Medicine Research Tool)'
+        })
+        _shared_session = session
+    return _shared_session
+
+
+def close_shared_session():
+    global _shared_session
+    if _shared_session is not None:
+        _shared_session.close()
+        _shared_session = None
+
+
 class BaseWebProvider(ABC):
     """Base class for web search providers."""
     
@@ -44,13 +82,10 @@ class BaseWebProvider(ABC):
     source_types: List[SourceType] = []
     rate_limit: float = 1.0  # requests per second
     
-    def __init__(self, config: Dict = None):
+    def __init__(self, config: Dict = None, session: requests.Session = None):
         self.config = config or {}
         self.last_request = 0
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Grimmoire/0.1 (Traditional Medicine Research Tool)'
-        })
+        self.session = session or get_shared_session()
     
     def _rate_limit_wait(self):
         """Enforce rate limiting."""
@@ -64,18 +99,16 @@ class BaseWebProvider(ABC):
     def _get(self, url: str, params: Dict = None, headers: Dict = None, timeout: int = 30) -> requests.Response:
         """Make a rate-limited GET request."""
         self._rate_limit_wait()
-        if headers:
-            self.session.headers.update(headers)
-        response = self.session.get(url, params=params, timeout=timeout)
+        # Per-request headers merge over the session defaults; never mutate
+        # the shared session's header dict from one provider.
+        response = self.session.get(url, params=params, headers=headers, timeout=timeout)
         response.raise_for_status()
         return response
     
     def _post(self, url: str, data: Any = None, json: Dict = None, headers: Dict = None, timeout: int = 30) -> requests.Response:
         """Make a rate-limited POST request."""
         self._rate_limit_wait()
-        if headers:
-            self.session.headers.update(headers)
-        response = self.session.post(url, data=data, json=json, timeout=timeout)
+        response = self.session.post(url, data=data, json=json, headers=headers, timeout=timeout)
         response.raise_for_status()
         return response
     
@@ -600,17 +633,42 @@ _PROVIDERS: Dict[str, type] = {
 }
 
 
-def get_provider(name: str, config: Dict = None) -> Optional[BaseWebProvider]:
-    """Get a provider instance by name."""
+@lru_cache(maxsize=None)
+def _default_provider(name: str) -> Optional[BaseWebProvider]:
+    provider_class = _PROVIDERS.get(name)
+    return provider_class() if provider_class else None
+
+
+def get_provider(name: str, config: Dict = None,
+                 session: requests.Session = None) -> Optional[BaseWebProvider]:
+    """Get a provider instance by name.
+
+    Default-configured providers are memoized: construction is idempotent
+    and repeat searches reuse the same instance (which also lets each
+    provider's rate limiter remember its last request across commands).
+    """
+    if config is None and session is None:
+        return _default_provider(name.lower())
     provider_class = _PROVIDERS.get(name.lower())
     if provider_class:
-        return provider_class(config)
+        return provider_class(config, session)
     return None
 
 
+# Derived once: _PROVIDERS is fixed at import time, so the key list and the
+# registry-key -> display-name map never change afterwards.
+_PROVIDER_KEYS = tuple(_PROVIDERS)
+_PROVIDER_DISPLAY = {key: cls.name for key, cls in _PROVIDERS.items()}
+
+
 def list_providers() -> List[str]:
     """List all available provider names."""
-    return list(_PROVIDERS.keys())
+    return list(_PROVIDER_KEYS)
+
+
+def provider_display_name(name: str) -> str:
+    """Human-readable provider name without instantiating the provider."""
+    return _PROVIDER_DISPLAY.get(name.lower(), name)
 
 
 def get_providers_for_type(source_type: SourceType, config: Dict = None) -> List[BaseWebProvider]:
@@ -631,26 +689,53 @@ class WebSearchAggregator:
         self.enabled_providers = self.config.get("providers", list(_PROVIDERS.keys()))
     
     def search(self, query: str, source_types: List[SourceType] = None, 
-               max_results: int = 20, max_per_provider: int = 10) -> List[WebSearchResult]:
-        """Search across all enabled providers."""
-        all_results = []
-        
+               max_results: int = 20, max_per_provider: int = 10,
+               on_batch: Callable = None) -> List[WebSearchResult]:
+        """Search across all enabled providers.
+
+        Providers are queried concurrently — each is an independent HTTP
+        client, so total latency is the slowest provider rather than the
+        sum of a dozen sequential round trips. When `on_batch` is given it
+        is called with each provider's result list as that provider
+        finishes, so callers can render results at min-provider-latency
+        instead of waiting for the slowest.
+        """
+        providers = []
         for provider_name in self.enabled_providers:
-            provider = get_provider(provider_name, self.config)
+            # None (not {}) routes default setups to the memoized instances
+            provider = get_provider(provider_name, self.config or None)
             if not provider:
                 continue
-            
             # Filter by source type if specified
             if source_types:
                 if not any(provider.supports(st) for st in source_types):
                     continue
-            
+            providers.append(provider)
+        
+        if not providers:
+            return []
+        
+        def search_one(provider):
             try:
-                results = provider.search(query, max_per_provider)
-                all_results.extend(results)
+                return provider.search(query, max_per_provider)
             except Exception:
-                # Provider failed, continue with others
-                continue
+                # Provider failed; its results are simply absent
+                return []
+        
+        all_results = []
+        if len(providers) == 1:
+            results = search_one(providers[0])
+            if on_batch and results:
+                on_batch(results)
+            all_results.extend(results)
+        else:
+            with ThreadPoolExecutor(max_workers=min(10, len(providers))) as pool:
+                futures = [pool.submit(search_one, provider) for provider in providers]
+                for future in as_completed(futures):
+                    results = future.result()
+                    if on_batch and results:
+                        on_batch(results)
+                    all_results.extend(results)
         
         # Sort by score (if providers set different scores) and limit
         all_results.sort(key=lambda r: r.score, reverse=True)
@@ -53,7 +53,7 @@ check_python() {
     elif command -v python &> /dev/null; then
         PYTHON_CMD="python"
     else
-        log_error "Python not found. Please install Python 3.9 or higher."
+        log_error "Python not found. Please install Python 3.10 or higher."
         exit 1
     fi
     
@@ -61,8 +61,8 @@ check_python() {
     PYTHON_MAJOR=$($PYTHON_CMD -c 'import sys; print(sys.version_info.major)')
     PYTHON_MINOR=$($PYTHON_CMD -c 'import sys; print(sys.version_info.minor)')
     
-    if [[ "$PYTHON_MAJOR" -lt 3 ]] || [[ "$PYTHON_MAJOR" -eq 3 && "$PYTHON_MINOR" -lt 9 ]]; then
-        log_error "Python 3.9+ required. Found: $PYTHON_VERSION"
+    if [[ "$PYTHON_MAJOR" -lt 3 ]] || [[ "$PYTHON_MAJOR" -eq 3 && "$PYTHON_MINOR" -lt 10 ]]; then
+        log_error "Python 3.10+ required. Found: $PYTHON_VERSION"
         exit 1
     fi
     